@@ -23,14 +23,23 @@ import subprocess
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
+import docker
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fogbed import Container, FogbedExperiment
 from fogbed_iota import IotaNetwork
 from fogbed_iota.client.cli import IotaCLI
+from fogbed_iota.utils.parser import (
+    extract_json_from_output,
+    strip_ansi,
+    tx_digest,
+    tx_looks_successful,
+)
 
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -39,6 +48,7 @@ logger = logging.getLogger(__name__)
 NETWORK_STABILIZATION_TIME = 45
 CLIENT_IP = "10.0.0.100"
 GATEWAY_IP = "10.0.0.5"
+GATEWAY_RPC_URL = f"http://{GATEWAY_IP}:9000"
 
 PACKAGE_HOST_DIR = Path("contracts/counter")
 PACKAGE_CONTAINER_DIR = "/contracts/counter"
@@ -149,6 +159,29 @@ class WorkflowGuard:
         except Exception:
             pass
 
+    @staticmethod
+    def _force_remove(container) -> None:
+        try:
+            container.remove(force=True)
+        except docker.errors.NotFound:
+            pass
+
+    def _remove_mininet_containers(self) -> None:
+        # Uma conexão com o daemon em vez de `docker ps | xargs docker rm -f`
+        try:
+            client = docker.from_env()
+            try:
+                containers = client.containers.list(all=True, filters={"name": r"^mn\."})
+                if containers:
+                    # A API não tem remoção em lote: dispara todas em paralelo
+                    with ThreadPoolExecutor(max_workers=min(len(containers), 8)) as pool:
+                        list(pool.map(self._force_remove, containers))
+            finally:
+                client.close()
+        except Exception as exc:
+            print(f"[cleanup] docker SDK indisponivel ({exc}), usando CLI")
+            self._run(r"docker ps -aq --filter 'name=^mn\.' | xargs -r docker rm -f")
+
     def cleanup(self, reason: str = "unknown") -> None:
         if self.cleaned:
             return
@@ -162,8 +195,9 @@ class WorkflowGuard:
             except Exception as exc:
                 print(f"[cleanup] exp.stop() falhou: {exc}")
 
+        self._remove_mininet_containers()
+
         cmds = [
-            r"docker ps -aq --filter 'name=^mn\.' | xargs -r docker rm -f",
             r"pkill -9 -f 'mininet:' || true",
             r"pkill -9 -f 'mnexec' || true",
             r"sudo mn -c || true",
@@ -193,16 +227,17 @@ signal.signal(signal.SIGTERM, _handle_signal)
 atexit.register(lambda: guard.cleanup("atexit"))
 
 
+_RULE_HEAVY = "=" * 70
+_RULE_LIGHT = "─" * 70
+
+
 def print_header(title: str) -> None:
-    print("\n" + "=" * 70)
-    print(title.center(70))
-    print("=" * 70 + "\n")
+    # Um único write por bloco em vez de três prints (cada um com flush em TTY)
+    sys.stdout.write(f"\n{_RULE_HEAVY}\n{title.center(70)}\n{_RULE_HEAVY}\n\n")
 
 
 def print_step(step_num: int, description: str) -> None:
-    print("\n" + "─" * 70)
-    print(f"STEP {step_num}: {description}")
-    print("─" * 70 + "\n")
+    sys.stdout.write(f"\n{_RULE_LIGHT}\nSTEP {step_num}: {description}\n{_RULE_LIGHT}\n\n")
 
 
 def format_balance(mist: int) -> str:
@@ -210,49 +245,26 @@ def format_balance(mist: int) -> str:
     return f"{mist:,} MIST ({iota:.4f} IOTA)"
 
 
-def strip_ansi(text: str) -> str:
-    return re.sub(r"\x1B\[[0-?]*[ -/]*[@-~]", "", text or "")
-
-
-def extract_json_from_output(output: str) -> dict[str, Any]:
-    output_clean = strip_ansi(output)
-
-    clean_lines = []
-    for line in output_clean.splitlines():
-        stripped = line.strip()
-        if re.match(r"^\d{4}-\d{2}-\d{2}T", stripped):
-            continue
-        if stripped.startswith(("[note]", "FETCHING", "Cloning", "Updating", "Compiling")):
-            continue
-        clean_lines.append(line)
-
-    output_clean = "\n".join(clean_lines).strip()
-
-    if output_clean.startswith("{") or output_clean.startswith("["):
-        try:
-            data = json.loads(output_clean)
-            if isinstance(data, dict):
-                return data
-        except json.JSONDecodeError:
-            pass
-
-    decoder = json.JSONDecoder()
-    for pos, ch in enumerate(output_clean):
-        if ch != "{":
-            continue
-        try:
-            obj, _ = decoder.raw_decode(output_clean, pos)
+def extract_tx_json(output: str) -> dict[str, Any]:
+    """
+    extract_json_from_output que aceita um array JSON no topo da saida:
+    devolve o primeiro objeto dentro dele, em vez de falhar
+    """
+    try:
+        return extract_json_from_output(output)
+    except ValueError:
+        clean = strip_ansi(output)
+        decoder = json.JSONDecoder()
+        for pos, ch in enumerate(clean):
+            if ch != "{":
+                continue
+            try:
+                obj, _ = decoder.raw_decode(clean, pos)
+            except json.JSONDecodeError:
+                continue
             if isinstance(obj, dict):
                 return obj
-        except json.JSONDecodeError:
-            continue
-
-    raise ValueError(f"Nenhum JSON valido encontrado. Preview:\n{output_clean[:800]}")
-
-
-def tx_digest(tx: dict[str, Any]) -> str:
-    effects = tx.get("effects") or {}
-    return tx.get("digest") or effects.get("transactionDigest") or "N/A"
+        raise
 
 
 def tx_error_message(tx: dict[str, Any]) -> str:
@@ -265,33 +277,6 @@ def tx_error_message(tx: dict[str, Any]) -> str:
     return str(tx)
 
 
-def tx_looks_successful(tx: dict[str, Any]) -> bool:
-    if not isinstance(tx, dict) or not tx:
-        return False
-
-    effects = tx.get("effects") or {}
-    status = effects.get("status") or {}
-    top_status = tx.get("status")
-    error_msg = tx.get("error")
-
-    if isinstance(status, dict):
-        effects_status = status.get("status")
-        error_msg = error_msg or status.get("error")
-    else:
-        effects_status = str(status) if status else ""
-
-    digest = tx.get("digest") or effects.get("transactionDigest")
-
-    return any([
-        top_status == "success",
-        effects_status == "success",
-        bool(tx.get("confirmedLocalExecution")),
-        "objectChanges" in tx,
-        "balanceChanges" in tx,
-        bool(digest) and not error_msg,
-    ])
-
-
 def extract_first_address(text: str) -> Optional[str]:
     match = re.search(r"(0x[a-fA-F0-9]{64})", text or "")
     return match.group(1) if match else None
@@ -314,6 +299,31 @@ def assert_client_network_ready(client_container) -> None:
         )
 
 
+def wait_for_checkpoint_progress(client_container, timeout: float = NETWORK_STABILIZATION_TIME) -> int:
+    """
+    Aguarda o gateway reportar checkpoint > 0 (consenso produzindo blocos),
+    com backoff exponencial, em vez de dormir o tempo máximo sempre.
+    """
+    payload = '{"jsonrpc":"2.0","id":1,"method":"iota_getLatestCheckpointSequenceNumber","params":[]}'
+    deadline = time.time() + timeout
+    delay = 0.5
+    while True:
+        raw = client_container.cmd(
+            f"curl -s -m 3 -X POST {GATEWAY_RPC_URL} -H 'Content-Type: application/json' "
+            f"-d {shlex.quote(payload)} 2>/dev/null"
+        )
+        try:
+            seq = int(json.loads(strip_ansi(raw).strip()).get("result", 0))
+        except Exception:
+            seq = 0
+        if seq > 0:
+            return seq
+        if time.time() + delay > deadline:
+            raise RuntimeError(f"Rede nao produziu checkpoints em {timeout}s (ultima resposta: {raw[:200]!r})")
+        time.sleep(delay)
+        delay = min(delay * 2, 5.0)
+
+
 def get_funder_address(client_container) -> str:
     logger.info("Descobrindo funder address do genesis keystore...")
 
@@ -357,11 +367,21 @@ def get_funder_address(client_container) -> str:
     )
 
 
+_CLI_BY_CONTAINER: dict[str, IotaCLI] = {}
+
+
+def get_cli(client_container) -> IotaCLI:
+    # IotaCLI() faz `which iota` + `client envs` a cada construção; reusa por container
+    key = getattr(client_container, "name", str(id(client_container)))
+    cli = _CLI_BY_CONTAINER.get(key)
+    if cli is None:
+        cli = _CLI_BY_CONTAINER[key] = IotaCLI(client_container, network="localnet")
+    return cli
+
+
 def check_account_balance(client_container, address: str) -> int:
-    cli = IotaCLI(client_container, network="localnet")
     try:
-        coins = cli.get_gas(address)
-        return sum(int(c.get("balance", 0)) for c in coins)
+        return get_cli(client_container).get_balance(address)
     except Exception as exc:
         logger.warning(f"Falha ao consultar saldo de {address}: {exc}")
         return 0
@@ -385,7 +405,7 @@ def safe_ptb_transfer(
     )
 
     raw = client_container.cmd(cmd)
-    tx = extract_json_from_output(raw)
+    tx = extract_tx_json(raw)
 
     if not tx_looks_successful(tx):
         raise RuntimeError(f"Transferencia falhou: {tx_error_message(tx)}")
@@ -418,7 +438,7 @@ def fund_accounts_via_transfer(client_container, accounts: list, funder_address:
             )
             time.sleep(2)
             balance = check_account_balance(client_container, account.address)
-            print(f" OK {format_balance(balance)} ({tx_digest(tx)})")
+            print(f" OK {format_balance(balance)} ({tx_digest(tx, 'N/A')})")
             funded_count += 1
         except Exception as exc:
             print(f" Error: {exc}")
@@ -437,13 +457,13 @@ def create_contract_files_on_host() -> None:
 
 
 def create_contract_files_in_container(client_container) -> bool:
-    client_container.cmd("mkdir -p /contracts/counter/sources")
-    client_container.cmd("cat > /contracts/counter/Move.toml <<'EOF'\n" + MOVE_TOML + "\nEOF")
-    client_container.cmd(
-        "cat > /contracts/counter/sources/counter.move <<'EOF'\n" + COUNTER_MOVE + "\nEOF"
-    )
+    # Um único round-trip no shell do container: mkdir + heredocs + verificação
+    # agrupados em { ...; } para que o prompt só volte ao final
     verify = client_container.cmd(
-        'test -f /contracts/counter/Move.toml && echo "OK" || echo "FAILED"'
+        "mkdir -p /contracts/counter/sources && {\n"
+        "cat > /contracts/counter/Move.toml <<'EOF'\n" + MOVE_TOML + "\nEOF\n"
+        "cat > /contracts/counter/sources/counter.move <<'EOF'\n" + COUNTER_MOVE + "\nEOF\n"
+        '} && test -f /contracts/counter/Move.toml && echo "OK" || echo "FAILED"'
     )
     return "OK" in verify
 
@@ -518,7 +538,7 @@ def safe_call_move_function(
     )
 
     raw = client_container.cmd(cmd)
-    tx = extract_json_from_output(raw)
+    tx = extract_tx_json(raw)
 
     if not tx_looks_successful(tx):
         suffix = f" | erro anterior: {last_error}" if last_error else ""
@@ -531,6 +551,29 @@ def find_counter_from_create_result(cli: IotaCLI, create_result: dict, owner_add
     def is_counter_type(text: str) -> bool:
         return "counter::counter::Counter" in text or "counter::Counter" in text
 
+    # O shell do container é único (não thread-safe), então em vez de paralelizar
+    # `iota client object` garantimos que cada ID seja consultado uma única vez
+    # entre as etapas 2, 3 e 4.
+    inspected: set[str] = set()
+
+    def inspect_counter(obj_id: str) -> tuple[bool, Optional[str]]:
+        if obj_id in inspected:
+            return False, None
+        inspected.add(obj_id)
+        try:
+            details = cli.get_object(obj_id)
+        except Exception:
+            return False, None
+        if not is_counter_type(json.dumps(details, default=str)):
+            return False, None
+        shared_version = None
+        owner = details.get("owner") if isinstance(details, dict) else None
+        if isinstance(owner, dict):
+            shared = owner.get("Shared") or owner.get("shared")
+            if isinstance(shared, dict):
+                shared_version = shared.get("initial_shared_version") or shared.get("initialSharedVersion")
+        return True, str(shared_version) if shared_version is not None else None
+
     # 1) objectChanges
     for change in create_result.get("objectChanges", []) or []:
         object_type = str(change.get("objectType", "") or "")
@@ -553,37 +596,17 @@ def find_counter_from_create_result(cli: IotaCLI, create_result: dict, owner_add
             )
             if not obj_id:
                 continue
-            try:
-                details = cli.get_object(obj_id)
-                details_str = json.dumps(details, default=str)
-                if is_counter_type(details_str):
-                    shared_version = None
-                    owner = details.get("owner") if isinstance(details, dict) else None
-                    if isinstance(owner, dict):
-                        shared = owner.get("Shared") or owner.get("shared")
-                        if isinstance(shared, dict):
-                            shared_version = shared.get("initial_shared_version") or shared.get("initialSharedVersion")
-                    return obj_id, str(shared_version) if shared_version is not None else None
-            except Exception:
-                continue
+            found, shared_version = inspect_counter(obj_id)
+            if found:
+                return obj_id, shared_version
 
     # 3) procurar qualquer object id citado no payload bruto
     payload_text = json.dumps(create_result, default=str)
     candidate_ids = set(re.findall(r"0x[a-fA-F0-9]{64}", payload_text))
     for obj_id in candidate_ids:
-        try:
-            details = cli.get_object(obj_id)
-            details_str = json.dumps(details, default=str)
-            if is_counter_type(details_str):
-                shared_version = None
-                owner = details.get("owner") if isinstance(details, dict) else None
-                if isinstance(owner, dict):
-                    shared = owner.get("Shared") or owner.get("shared")
-                    if isinstance(shared, dict):
-                        shared_version = shared.get("initial_shared_version") or shared.get("initialSharedVersion")
-                return obj_id, str(shared_version) if shared_version is not None else None
-        except Exception:
-            continue
+        found, shared_version = inspect_counter(obj_id)
+        if found:
+            return obj_id, shared_version
 
     # 4) fallback: listar objetos do owner e inspecionar
     if owner_address:
@@ -593,13 +616,9 @@ def find_counter_from_create_result(cli: IotaCLI, create_result: dict, owner_add
                 obj_id = item.get("objectId") or item.get("object_id") or item.get("objectId")
                 if not obj_id:
                     continue
-                try:
-                    details = cli.get_object(obj_id)
-                    details_str = json.dumps(details, default=str)
-                    if is_counter_type(details_str):
-                        return obj_id, None
-                except Exception:
-                    continue
+                found, _ = inspect_counter(obj_id)
+                if found:
+                    return obj_id, None
         except Exception:
             pass
 
@@ -669,10 +688,7 @@ def main() -> None:
         guard.attach_experiment(exp)
 
         iota_net = IotaNetwork(exp, image="iota-dev:latest")
-        iota_net.add_validator("iota1", "10.0.0.1")
-        iota_net.add_validator("iota2", "10.0.0.2")
-        iota_net.add_validator("iota3", "10.0.0.3")
-        iota_net.add_validator("iota4", "10.0.0.4")
+        iota_net.add_validators((f"iota{i}", f"10.0.0.{i}") for i in range(1, 5))
         iota_net.add_gateway("gateway", "10.0.0.5")
 
         client = Container(
@@ -688,13 +704,14 @@ def main() -> None:
         exp.start()
         iota_net.start()
 
-        print(f"Aguardando estabilizacao da rede ({NETWORK_STABILIZATION_TIME}s)...")
-        time.sleep(NETWORK_STABILIZATION_TIME)
-
         assert_client_network_ready(client)
 
+        print(f"Aguardando checkpoints do consenso (ate {NETWORK_STABILIZATION_TIME}s)...")
+        checkpoint = wait_for_checkpoint_progress(client)
+        print(f"Rede pronta: checkpoint {checkpoint}")
+
         print_step(2, "Initialize CLI Tools and Managers")
-        cli = IotaCLI(client, network="localnet")
+        cli = get_cli(client)
         acct_mgr = iota_net.account_manager
         contract_mgr = iota_net.contract_manager
 
@@ -818,7 +835,7 @@ def main() -> None:
                 args=[counter_id],
                 gas_budget=10_000_000,
             )
-            print(f" Increment {i + 1}: {tx_digest(result)}")
+            print(f" Increment {i + 1}: {tx_digest(result, 'N/A')}")
             time.sleep(2)
 
         print_step(10, "Transfer Alice -> Bob via PTB")
@@ -839,7 +856,7 @@ def main() -> None:
                 amount_mist=transfer_amount,
                 gas_budget=10_000_000,
             )
-            print(f"Transferencia concluida: {tx_digest(result)}")
+            print(f"Transferencia concluida: {tx_digest(result, 'N/A')}")
         else:
             print("Transferencia pulada: saldo insuficiente apos reservar gas.")
 
@@ -1,4 +1,4 @@
-import os
+import subprocess
 from typing import Dict, List, Optional
 
 from fogbed_iota.utils import get_logger
@@ -14,9 +14,10 @@ class AccountManager:
     Gerencia criação e tracking de contas IOTA
     """
 
-    def __init__(self, client_container):
+    def __init__(self, client_container, cli: Optional[IotaCLI] = None):
         self.client = client_container
-        self.cli = IotaCLI(client_container)
+        # Reusa um IotaCLI já verificado: construir outro repete `which iota` e o switch de env
+        self.cli = cli if cli is not None else IotaCLI(client_container)
         self.accounts: Dict[str, IotaAccount] = {}
         self.keystore_path = "/root/.iota/iota.keystore"
 
@@ -58,8 +59,7 @@ class AccountManager:
         logger.info(f"Querying balance for {alias} ({account.address[:16]}...)")
 
         try:
-            coins = self.cli.get_gas(account.address)
-            total = sum(c.get("balance", 0) for c in coins)
+            total = self.cli.get_balance(account.address)
             account._balance = total
             logger.info(f"Balance for {alias}: {total} MIST")
             return total
@@ -76,12 +76,15 @@ class AccountManager:
         """
         logger.warning("⚠️  Exporting keystore with PRIVATE KEYS")
 
-        copy_cmd = f"docker cp mn.{self.client.name}:{self.keystore_path} {output_path}"
-        result = os.system(copy_cmd)
+        # argv direto: sem /bin/sh intermediário nem interpretação dos caminhos pelo shell
+        result = subprocess.run(
+            ["docker", "cp", f"mn.{self.client.name}:{self.keystore_path}", output_path],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
 
-        if result == 0:
+        if result.returncode == 0:
             logger.info(f"Keystore exported to {output_path}")
             return output_path
         else:
-            logger.error("Failed to export keystore")
+            logger.error(f"Failed to export keystore: {result.stderr.decode(errors='replace').strip()}")
             return None
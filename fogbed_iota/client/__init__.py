@@ -1,7 +1,14 @@
-"""Cliente IOTA para fogbed-iota"""
+"""
+Cliente IOTA para fogbed-iota
+
+AsyncIotaRpcClient mantém um pool HTTP keep-alive por instância: use
+``async with AsyncIotaRpcClient(url) as client:`` (ou ``await client.aclose()``).
+Com ``share_pool=True`` os clientes dividem um pool por event loop, liberado
+por ``await close_shared_pool()``.
+"""
 __version__ = "1.1.0"
 
-from .rpc_client import IotaRpcClient, AsyncIotaRpcClient
+from .rpc_client import IotaRpcClient, AsyncIotaRpcClient, close_shared_pool
 from .graphql_client import IotaGraphQLClient
 from .transaction import TransactionBuilder, SimpleTransaction
 from .exceptions import (
@@ -15,6 +22,7 @@ from .exceptions import (
 __all__ = [
     "IotaRpcClient",
     "AsyncIotaRpcClient",
+    "close_shared_pool",
     "IotaGraphQLClient",
     "IotaClientError",
     "IotaRpcError",
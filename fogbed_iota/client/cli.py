@@ -12,6 +12,7 @@ import time
 from typing import Dict, List, Optional, Any
 
 from fogbed_iota.utils import get_logger
+from fogbed_iota.utils.parser import extract_json_from_output
 from fogbed_iota.client.exceptions import (
     IotaClientException,
     TransactionFailedException,
@@ -25,6 +26,7 @@ class IotaCLI:
         self.container = container
         self.network = network
         self.client_config = client_config
+        self._reference_gas_price: Optional[int] = None
         self._verify_cli_available()
         self._select_network_best_effort()
         logger.info(f"IotaCLI initialized for network: {network}")
@@ -72,11 +74,12 @@ class IotaCLI:
         try:
             result = self.container.cmd(full_cmd)
 
-            if ("error" in result.lower() or "failed" in result.lower()) and ("timeout" not in result.lower()):
+            lowered = result.lower()
+            if ("error" in lowered or "failed" in lowered) and ("timeout" not in lowered):
                 logger.warning(f"Command may have failed: {result[:250]}")
 
             # Try to parse JSON output proactively when requested or when output looks like JSON
-            if capture_json or result.strip().startswith("{") or result.strip().startswith("["):
+            if capture_json or result.lstrip().startswith(("{", "[")):
                 # Tentar parse direto primeiro
                 try:
                     return json.loads(result)
@@ -133,17 +136,40 @@ class IotaCLI:
         return m.group(1) if m else None
 
     def switch_address(self, address: str) -> bool:
-        out = self._execute(f"iota client switch --address {address}")
-        return ("switched" in out.lower()) or ("active" in out.lower())
+        out = self._execute(f"iota client switch --address {address}").lower()
+        return ("switched" in out) or ("active" in out)
 
     # -------- Gas / Coins --------
 
     def get_gas(self, address: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Gas coins de ``address`` via ``iota client gas --json`` (um ``json.loads``,
+        sem depender do layout da tabela). Recai sobre a tabela em texto quando
+        o CLI não devolve JSON.
+        """
         cmd = "iota client gas"
         if address:
             cmd += f" {address}"
-        out = self._execute(cmd)
+        out = self._execute(f"{cmd} --json", capture_json=True)
+
+        if isinstance(out, list):
+            coins: List[Dict[str, Any]] = []
+            for item in out:
+                if not isinstance(item, dict):
+                    continue
+                coin_id = item.get("gasCoinId") or item.get("coinObjectId")
+                balance = next(
+                    (item[k] for k in ("nanosBalance", "mistBalance", "balance") if k in item),
+                    None,
+                )
+                if coin_id and balance is not None:
+                    coins.append({"object_id": coin_id, "balance": int(balance)})
+            return coins
+
+        return self._parse_gas_table(self._execute(cmd))
 
+    @staticmethod
+    def _parse_gas_table(out: str) -> List[Dict[str, Any]]:
         coins: List[Dict[str, Any]] = []
         for line in out.splitlines():
             if "0x" not in line:
@@ -165,11 +191,42 @@ class IotaCLI:
 
         return coins
 
-    def get_reference_gas_price(self) -> int:
+    def get_balance(self, address: Optional[str] = None, coin_type: str = "::iota::IOTA") -> int:
+        """
+        Saldo total (em MIST) de ``coin_type`` via um único ``iota client balance --json``.
+        Recai sobre a soma de ``get_gas`` quando o CLI não devolve JSON.
+        """
+        cmd = "iota client balance"
+        if address:
+            cmd += f" {address}"
+        out = self._execute(f"{cmd} --json", capture_json=True)
+
+        if isinstance(out, (dict, list)):
+            total = 0
+            stack: List[Any] = [out]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, dict):
+                    if "coinObjectId" in item and "balance" in item:
+                        if str(item.get("coinType", "")).endswith(coin_type):
+                            total += int(item["balance"])
+                        continue
+                    stack.extend(item.values())
+                elif isinstance(item, list):
+                    stack.extend(item)
+            return total
+
+        return sum(int(c.get("balance", 0)) for c in self.get_gas(address))
+
+    def get_reference_gas_price(self, refresh: bool = False) -> int:
+        # O preço de referência só muda na troca de época; consulta uma vez por instância
+        if self._reference_gas_price is not None and not refresh:
+            return self._reference_gas_price
         # v1.15.0 não tem `gas-price`; o próprio CLI sugere `gas`
         out = self._execute("iota client gas")
         m = re.search(r"(\d+)", out)
-        return int(m.group(1)) if m else 1000
+        self._reference_gas_price = int(m.group(1)) if m else 1000
+        return self._reference_gas_price
 
     # -------- Objects --------
 
@@ -298,7 +355,8 @@ class IotaCLI:
                     except Exception:
                         pass
                 else:
-                    if "success" in out.lower() or "transferred" in out.lower():
+                    lowered = out.lower()
+                    if "success" in lowered or "transferred" in lowered:
                         return True
             except Exception:
                 # Fallback to string check for any unexpected types
@@ -308,38 +366,33 @@ class IotaCLI:
                 except Exception:
                     pass
 
-            time.sleep(2)
+            if attempt < max_retries - 1:
+                time.sleep(2)
 
         return False
 
     # -------- Move --------
 
     def move_build(self, package_path: str) -> bool:
-        out = self._execute(f"iota move build --path {package_path}", timeout=300)
-        return ("build successful" in out.lower()) or ("success" in out.lower())
+        out = self._execute(f"iota move build --path {package_path}", timeout=300).lower()
+        return ("build successful" in out) or ("success" in out)
 
     def publish_package(self, package_path: str, gas_budget: int = 100_000_000, sender: Optional[str] = None) -> Dict[str, Any]:
-        import subprocess
-
         original = None
         if sender:
             original = self.get_active_address()
             self.switch_address(sender)
 
         try:
-            container_name = getattr(self.container, "name", "client")
-            docker_name = f"mn.{container_name}" if not str(container_name).startswith("mn.") else str(container_name)
-
-            shell_cmd = (
-                f"docker exec {docker_name} bash -lc "
-                f"\"iota client publish {package_path} --gas-budget {gas_budget} --json 2>&1\""
+            # Reusa o shell persistente do container em vez de um `docker exec` por publicação
+            out = self._execute(
+                f"iota client publish {shlex.quote(package_path)} --gas-budget {gas_budget} --json",
+                timeout=300,
+                capture_json=True,
             )
-
-            out = subprocess.check_output(shell_cmd, shell=True, text=True, stderr=subprocess.STDOUT)
-
-            from fogbed_iota.utils.parser import extract_json_from_output
-            parsed = extract_json_from_output(out)
-            return parsed
+            if isinstance(out, dict):
+                return out
+            return extract_json_from_output(out)
 
         finally:
             if sender and original:
@@ -1,21 +1,200 @@
+import asyncio
+import importlib.util
+import itertools
 import json
+import math
+import socket
+import time
+import weakref
+from urllib.parse import urlsplit
+import httpx
 import requests
-from typing import Any, Dict, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from .exceptions import IotaRpcError, IotaConnectionError, IotaTimeoutError
 from fogbed_iota.utils import get_logger
 
+try:
+    import orjson
+except ImportError:  # extra opcional: pip install fogbed-iota[fast]
+    orjson = None
+
 logger = get_logger(__name__)
 
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+# Sem Nagle (requests pequenos de request/response) e com keepalive de TCP
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter cujo pool abre os sockets com ``_SOCKET_OPTIONS``."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+# httpx só negocia HTTP/2 com o pacote h2 instalado (extra [fast])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# TTL (s) das leituras idempotentes: chain id é imutável, metadata de coin
+# não muda após publicada, gas price/comitê só mudam na troca de época
+_CACHE_TTLS: Dict[str, float] = {
+    "iota_getChainIdentifier": math.inf,
+    "iotax_getCoinMetadata": 3600,
+    "iotax_getReferenceGasPrice": 5,
+    "iotax_getCommitteeInfo": 30,
+}
+
+
+def _host_port(endpoint: str) -> Tuple[str, int]:
+    parts = urlsplit(endpoint)
+    return parts.hostname or "localhost", parts.port or (443 if parts.scheme == "https" else 80)
+
+
+# Timeout (s) do probe TCP de health_check
+HEALTH_PROBE_TIMEOUT = 1
+
+
+def _decode_response(response: Any, expected: Union[type, Tuple[type, ...]] = dict) -> Any:
+    """
+    Caminho rápido: JSON-RPC responde 200 mesmo para erros de protocolo, então
+    basta comparar o status (sem ``raise_for_status``) antes de decodificar.
+    Corpo que não é JSON (ex.: HTML de um proxy) ou do tipo errado vira
+    ``IotaConnectionError``; ``expected`` é ``dict`` numa chamada simples.
+    """
+    status = response.status_code
+    if status != 200:
+        raise IotaConnectionError(f"HTTP {status}: {response.text[:200]}")
+    try:
+        data = _json_loads(response.content)
+    except ValueError as e:
+        raise IotaConnectionError(f"Invalid JSON response: {e}")
+    if not isinstance(data, expected):
+        raise IotaConnectionError(f"Unexpected JSON-RPC response type: {type(data).__name__}")
+    return data
+
+
+def _rpc_error(error: Dict[str, Any]) -> IotaRpcError:
+    return IotaRpcError(
+        code=error.get("code", -1),
+        message=error.get("message", "Unknown error"),
+        data=error.get("data")
+    )
+
+
+def _batch_payload(calls: List[Tuple[str, List[Any]]], next_id) -> List[Dict[str, Any]]:
+    return [
+        {"jsonrpc": "2.0", "id": next_id(), "method": method, "params": params or []}
+        for method, params in calls
+    ]
+
+
+def _batch_results(payload: List[Dict[str, Any]], data: Any) -> List[Any]:
+    """
+    Casa as respostas de um batch JSON-RPC com os pedidos pelo ``id`` (o
+    servidor pode responder fora de ordem) e devolve os resultados na ordem
+    dos pedidos. Qualquer entrada com ``error`` vira ``IotaRpcError``.
+    """
+    if isinstance(data, dict):
+        error = data.get("error")
+        if error is not None:
+            raise _rpc_error(error)
+    if not isinstance(data, list):
+        raise IotaRpcError(code=-1, message="Malformed batch response: expected a JSON array")
+    by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+    results = []
+    for request in payload:
+        item = by_id.get(request["id"])
+        if item is None:
+            raise IotaRpcError(code=-1, message=f"Missing batch response for {request['method']} (id={request['id']})")
+        error = item.get("error")
+        if error is not None:
+            raise _rpc_error(error)
+        results.append(item.get("result"))
+    return results
+
+
+def _iter_pages(fetch: Callable[[Optional[str]], Dict[str, Any]]) -> Iterator[Any]:
+    """Percorre uma resposta paginada ``{data, nextCursor, hasNextPage}`` item a item."""
+    cursor = None
+    while True:
+        page = fetch(cursor)
+        yield from page.get("data") or []
+        cursor = page.get("nextCursor")
+        if not page.get("hasNextPage") or cursor is None:
+            return
+
+
+async def _aiter_pages(fetch: Callable[[Optional[str]], Awaitable[Dict[str, Any]]]) -> AsyncIterator[Any]:
+    """
+    Versão assíncrona de ``_iter_pages``: a próxima página já é buscada
+    enquanto o consumidor processa os itens da atual.
+    """
+    pending = asyncio.ensure_future(fetch(None))
+    try:
+        while pending is not None:
+            page = await pending
+            cursor = page.get("nextCursor")
+            if page.get("hasNextPage") and cursor is not None:
+                pending = asyncio.ensure_future(fetch(cursor))
+            else:
+                pending = None
+            for item in page.get("data") or []:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 class IotaRpcClient:
+    """
+    Cliente JSON-RPC síncrono. Uma única ``requests.Session`` é mantida por
+    instância (keep-alive entre chamadas); use ``with IotaRpcClient(...)``
+    ou chame ``close()`` ao final.
+    """
+
+    __slots__ = ("endpoint", "timeout", "headers", "_id_iter", "_cache", "_session", "_host", "_port")
+
     def __init__(self, endpoint: str, timeout: int = 30, headers: Optional[Dict[str, str]] = None):
         self.endpoint = endpoint.rstrip('/')
         self.timeout = timeout
         self.headers = headers or {"Content-Type": "application/json"}
-        self._request_id = 0
+        self._host, self._port = _host_port(self.endpoint)
+        # next() em itertools.count é um passo atômico sob o GIL: ids únicos entre threads
+        self._id_iter = itertools.count(1)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # O corpo vai serializado em bytes (data=), então o Content-Type é explícito
+        self._session.headers.setdefault("Content-Type", "application/json")
+        adapter = _KeepAliveAdapter(pool_connections=1, pool_maxsize=32, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def __enter__(self) -> "IotaRpcClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
         
     def _next_id(self) -> int:
-        self._request_id += 1
-        return self._request_id
+        return next(self._id_iter)
     
     def next_id(self) -> int:
         return self._next_id()
@@ -28,19 +207,11 @@ class IotaRpcClient:
             "params": params or []
         }
         try:
-            response = requests.post(
-                self.endpoint, json=payload, 
-                headers=self.headers, timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-            if "error" in data:
-                error = data["error"]
-                raise IotaRpcError(
-                    code=error.get("code", -1),
-                    message=error.get("message", "Unknown error"),
-                    data=error.get("data")
-                )
+            response = self._session.post(self.endpoint, data=_json_dumps(payload), timeout=self.timeout)
+            data = _decode_response(response)
+            error = data.get("error")
+            if error is not None:
+                raise _rpc_error(error)
             return data.get("result")
         except requests.exceptions.Timeout:
             raise IotaTimeoutError(f"Request timeout after {self.timeout}s")
@@ -48,16 +219,47 @@ class IotaRpcClient:
             raise IotaConnectionError(f"Connection failed: {e}")
         except requests.exceptions.RequestException as e:
             raise IotaConnectionError(f"Request failed: {e}")
+
+    def _call_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """Envia ``[(method, params), ...]`` num único POST e devolve os resultados na mesma ordem."""
+        if not calls:
+            return []
+        payload = _batch_payload(calls, self._next_id)
+        try:
+            response = self._session.post(self.endpoint, data=_json_dumps(payload), timeout=self.timeout)
+            data = _decode_response(response, (list, dict))
+        except requests.exceptions.Timeout:
+            raise IotaTimeoutError(f"Request timeout after {self.timeout}s")
+        except requests.exceptions.ConnectionError as e:
+            raise IotaConnectionError(f"Connection failed: {e}")
+        except requests.exceptions.RequestException as e:
+            raise IotaConnectionError(f"Request failed: {e}")
+        return _batch_results(payload, data)
+
+    def _cached_call(self, method: str, params: List[Any] = None) -> Any:
+        key = (method, *(params or []))
+        hit = self._cache.get(key)
+        now = time.monotonic()
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        result = self._call(method, params)
+        self._cache[key] = (now + _CACHE_TTLS[method], result)
+        return result
+
+    def invalidate_cache(self) -> None:
+        """Descarta as leituras em cache (ex.: após troca de época)."""
+        self._cache.clear()
     
     # MÉTODOS RPC CORRETOS (iotax_)
     def get_balance(self, address: str, coin_type: str = "0x2::iota::IOTA") -> Dict[str, Any]:
         return self._call("iotax_getBalance", [address, coin_type])
+
+    def get_balances_batch(self, addresses: List[str], coin_type: str = "0x2::iota::IOTA") -> List[Dict[str, Any]]:
+        return self._call_batch([("iotax_getBalance", [address, coin_type]) for address in addresses])
     
     def get_coins(self, address: str, coin_type: str = "0x2::iota::IOTA", cursor: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
-        params = [address, coin_type]
-        if cursor: params.append(cursor)
-        params.append(limit)
-        return self._call("iotax_getCoins", params)
+        # Parâmetros posicionais: cursor ausente vai como null para o limit não ocupar o lugar dele
+        return self._call("iotax_getCoins", [address, coin_type, cursor, limit])
     
     def get_checkpoint(self, checkpoint_id: Union[str, int]) -> Dict[str, Any]:
         return self._call("iota_getCheckpoint", [str(checkpoint_id)])
@@ -67,25 +269,41 @@ class IotaRpcClient:
         if options: params.append(options)
         return self._call("iota_getTransactionBlock", params)
     
-    def health_check(self) -> bool:
+    def health_check(self, probe: str = "rpc") -> bool:
+        """
+        Por padrão faz uma chamada JSON-RPC real (fora do cache);
+        ``probe="tcp"`` só testa se a porta RPC aceita conexão, mais barato
+        mas sem garantir que o nó já responde requests.
+        """
+        if probe == "tcp":
+            try:
+                with socket.create_connection((self._host, self._port), timeout=HEALTH_PROBE_TIMEOUT):
+                    return True
+            except OSError:
+                return False
         try:
-            self.get_chain_identifier()
+            self._call("iota_getChainIdentifier")
             return True
         except Exception:
             return False
     
     def get_chain_identifier(self) -> str:
-        return self._call("iota_getChainIdentifier")
+        return self._cached_call("iota_getChainIdentifier")
+
+    def get_coin_metadata(self, coin_type: str = "0x2::iota::IOTA") -> Dict[str, Any]:
+        return self._cached_call("iotax_getCoinMetadata", [coin_type])
+
+    def get_reference_gas_price(self) -> int:
+        return int(self._cached_call("iotax_getReferenceGasPrice"))
+
+    def get_committee_info(self, epoch: Optional[Union[str, int]] = None) -> Dict[str, Any]:
+        return self._cached_call("iotax_getCommitteeInfo", [str(epoch)] if epoch is not None else [])
     
     def get_latest_checkpoint_sequence_number(self) -> int:
         return int(self._call("iota_getLatestCheckpointSequenceNumber"))
     
     def get_owned_objects(self, address: str, query: Optional[Dict[str, Any]] = None, cursor: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
-        params = [address]
-        if query: params.append(query)
-        if cursor: params.append(cursor)
-        params.append(limit)
-        return self._call("iotax_getOwnedObjects", params)
+        return self._call("iotax_getOwnedObjects", [address, query, cursor, limit])
     
     def get_object(self, object_id: str, options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         params = [object_id]
@@ -98,10 +316,288 @@ class IotaRpcClient:
     def get_events(self, query: Dict[str, Any]) -> Dict[str, Any]:
         return self._call("iota_getEvents", [query])
 
+    def query_events(self, query: Dict[str, Any], cursor: Optional[Dict[str, Any]] = None, limit: int = 50, descending: bool = False) -> Dict[str, Any]:
+        return self._call("iotax_queryEvents", [query, cursor, limit, descending])
+
+    def query_transaction_blocks(self, query: Dict[str, Any], cursor: Optional[str] = None, limit: int = 50, descending: bool = False) -> Dict[str, Any]:
+        return self._call("iotax_queryTransactionBlocks", [query, cursor, limit, descending])
+
+    # Iteradores sobre as consultas paginadas: seguem o nextCursor sozinhos
+    def iter_coins(self, address: str, coin_type: str = "0x2::iota::IOTA", limit: int = 50) -> Iterator[Dict[str, Any]]:
+        return _iter_pages(lambda cursor: self.get_coins(address, coin_type, cursor, limit))
+
+    def iter_owned_objects(self, address: str, query: Optional[Dict[str, Any]] = None, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        return _iter_pages(lambda cursor: self.get_owned_objects(address, query, cursor, limit))
+
+    def iter_events(self, query: Dict[str, Any], limit: int = 50, descending: bool = False) -> Iterator[Dict[str, Any]]:
+        return _iter_pages(lambda cursor: self.query_events(query, cursor, limit, descending))
+
+    def iter_transaction_blocks(self, query: Dict[str, Any], limit: int = 50, descending: bool = False) -> Iterator[Dict[str, Any]]:
+        return _iter_pages(lambda cursor: self.query_transaction_blocks(query, cursor, limit, descending))
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    Visão de um transport compartilhado: fechar o ``AsyncClient`` de um
+    cliente não derruba o pool dos demais.
+    """
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport):
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+# loop -> {http2: transport}; conexões httpx ficam presas ao loop que as abriu
+_SHARED_TRANSPORTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, httpx.AsyncHTTPTransport]]" = weakref.WeakKeyDictionary()
+
+
+def _shared_transport(http2: bool) -> httpx.AsyncHTTPTransport:
+    per_loop = _SHARED_TRANSPORTS.setdefault(asyncio.get_running_loop(), {})
+    transport = per_loop.get(http2)
+    if transport is None:
+        transport = per_loop[http2] = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=256,
+                max_keepalive_connections=64,
+                keepalive_expiry=60,
+            ),
+            socket_options=_SOCKET_OPTIONS,
+        )
+    return transport
+
+
+async def close_shared_pool() -> None:
+    """Fecha o pool compartilhado (``share_pool=True``) do loop atual."""
+    per_loop = _SHARED_TRANSPORTS.pop(asyncio.get_running_loop(), {})
+    for transport in per_loop.values():
+        await transport.aclose()
+
+
 class AsyncIotaRpcClient:
-    def __init__(self, endpoint: str, timeout: int = 30, headers: Optional[Dict[str, str]] = None):
+    """
+    Cliente JSON-RPC assíncrono (httpx). Uma única ``httpx.AsyncClient`` é
+    mantida por instância e reutilizada entre chamadas (keep-alive), então
+    prefira ``async with AsyncIotaRpcClient(...) as client:`` ou chame
+    ``aclose()`` ao final.
+
+    Com ``h2`` instalado, as chamadas concorrentes são multiplexadas em
+    HTTP/2 (endpoints https); passe ``http2=False`` para nós que não o suportam.
+
+    Com ``share_pool=True`` todas as instâncias do mesmo event loop usam um
+    único pool de conexões (um cliente por nó sem fragmentar o keep-alive);
+    feche-o com ``close_shared_pool()``.
+
+    ``transport`` substitui o transport httpx da sessão (ex.:
+    ``httpx.MockTransport`` em testes) e tem precedência sobre ``share_pool``.
+    """
+
+    __slots__ = ("endpoint", "timeout", "headers", "http2", "share_pool", "transport", "_session", "_id_iter", "_cache", "_host", "_port")
+
+    def __init__(
+        self,
+        endpoint: str,
+        timeout: int = 30,
+        headers: Optional[Dict[str, str]] = None,
+        http2: bool = True,
+        share_pool: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.endpoint = endpoint.rstrip('/')
         self.timeout = timeout
         self.headers = headers or {"Content-Type": "application/json"}
-        self._session = None
-        self._request_id = 0
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.share_pool = share_pool
+        self.transport = transport
+        self._host, self._port = _host_port(self.endpoint)
+        self._session: Optional[httpx.AsyncClient] = None
+        self._id_iter = itertools.count(1)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+    async def __aenter__(self) -> "AsyncIotaRpcClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def _get_session(self) -> httpx.AsyncClient:
+        # Criada sob demanda no primeiro _call; sem await entre o teste e a
+        # atribuição, então não há corrida entre corrotinas do mesmo loop
+        if self._session is None or self._session.is_closed:
+            if self.transport is not None:
+                transport = self.transport
+            elif self.share_pool:
+                transport = _SharedTransport(_shared_transport(self.http2))
+            else:
+                transport = httpx.AsyncHTTPTransport(
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=64,
+                        max_keepalive_connections=32,
+                        keepalive_expiry=30,
+                    ),
+                    socket_options=_SOCKET_OPTIONS,
+                )
+            self._session = httpx.AsyncClient(
+                headers={"Content-Type": "application/json", **self.headers},
+                timeout=self.timeout,
+                transport=transport,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def close(self) -> None:
+        await self.aclose()
+
+    def _next_id(self) -> int:
+        return next(self._id_iter)
+
+    async def _call(self, method: str, params: List[Any] = None) -> Any:
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._next_id(),
+            "method": method,
+            "params": params or []
+        }
+        try:
+            response = await self._get_session().post(self.endpoint, content=_json_dumps(payload))
+            data = _decode_response(response)
+            error = data.get("error")
+            if error is not None:
+                raise _rpc_error(error)
+            return data.get("result")
+        except httpx.TimeoutException:
+            raise IotaTimeoutError(f"Request timeout after {self.timeout}s")
+        except httpx.TransportError as e:
+            raise IotaConnectionError(f"Connection failed: {e}")
+        except httpx.HTTPError as e:
+            raise IotaConnectionError(f"Request failed: {e}")
+
+    async def _call_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        if not calls:
+            return []
+        payload = _batch_payload(calls, self._next_id)
+        try:
+            response = await self._get_session().post(self.endpoint, content=_json_dumps(payload))
+            data = _decode_response(response, (list, dict))
+        except httpx.TimeoutException:
+            raise IotaTimeoutError(f"Request timeout after {self.timeout}s")
+        except httpx.TransportError as e:
+            raise IotaConnectionError(f"Connection failed: {e}")
+        except httpx.HTTPError as e:
+            raise IotaConnectionError(f"Request failed: {e}")
+        return _batch_results(payload, data)
+
+    async def _cached_call(self, method: str, params: List[Any] = None) -> Any:
+        key = (method, *(params or []))
+        hit = self._cache.get(key)
+        now = time.monotonic()
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        result = await self._call(method, params)
+        self._cache[key] = (now + _CACHE_TTLS[method], result)
+        return result
+
+    def invalidate_cache(self) -> None:
+        self._cache.clear()
+
+    async def get_balance(self, address: str, coin_type: str = "0x2::iota::IOTA") -> Dict[str, Any]:
+        return await self._call("iotax_getBalance", [address, coin_type])
+
+    async def get_balances_batch(self, addresses: List[str], coin_type: str = "0x2::iota::IOTA") -> List[Dict[str, Any]]:
+        return await self._call_batch([("iotax_getBalance", [address, coin_type]) for address in addresses])
+
+    async def get_balances(self, addresses: List[str], coin_type: str = "0x2::iota::IOTA") -> List[Dict[str, Any]]:
+        """Um request por endereço, todos em paralelo no mesmo pool (para nós sem suporte a batch)."""
+        return list(await asyncio.gather(*[self.get_balance(address, coin_type) for address in addresses]))
+
+    async def get_coins(self, address: str, coin_type: str = "0x2::iota::IOTA", cursor: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        # Parâmetros posicionais: cursor ausente vai como null para o limit não ocupar o lugar dele
+        return await self._call("iotax_getCoins", [address, coin_type, cursor, limit])
+
+    async def get_checkpoint(self, checkpoint_id: Union[str, int]) -> Dict[str, Any]:
+        return await self._call("iota_getCheckpoint", [str(checkpoint_id)])
+
+    async def get_transaction_block(self, digest: str, options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+        params = [digest]
+        if options: params.append(options)
+        return await self._call("iota_getTransactionBlock", params)
+
+    async def health_check(self, probe: str = "rpc") -> bool:
+        if probe == "tcp":
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self._host, self._port), HEALTH_PROBE_TIMEOUT
+                )
+            except (OSError, asyncio.TimeoutError):
+                return False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return True
+        try:
+            await self._call("iota_getChainIdentifier")
+            return True
+        except Exception:
+            return False
+
+    async def get_chain_identifier(self) -> str:
+        return await self._cached_call("iota_getChainIdentifier")
+
+    async def get_coin_metadata(self, coin_type: str = "0x2::iota::IOTA") -> Dict[str, Any]:
+        return await self._cached_call("iotax_getCoinMetadata", [coin_type])
+
+    async def get_reference_gas_price(self) -> int:
+        return int(await self._cached_call("iotax_getReferenceGasPrice"))
+
+    async def get_committee_info(self, epoch: Optional[Union[str, int]] = None) -> Dict[str, Any]:
+        return await self._cached_call("iotax_getCommitteeInfo", [str(epoch)] if epoch is not None else [])
+
+    async def get_latest_checkpoint_sequence_number(self) -> int:
+        return int(await self._call("iota_getLatestCheckpointSequenceNumber"))
+
+    async def get_owned_objects(self, address: str, query: Optional[Dict[str, Any]] = None, cursor: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        return await self._call("iotax_getOwnedObjects", [address, query, cursor, limit])
+
+    async def get_object(self, object_id: str, options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+        params = [object_id]
+        if options: params.append(options)
+        return await self._call("iota_getObject", params)
+
+    async def get_objects(self, object_ids: List[str], options: Optional[Dict[str, bool]] = None) -> List[Dict[str, Any]]:
+        return list(await asyncio.gather(*[self.get_object(object_id, options) for object_id in object_ids]))
+
+    async def get_protocol_version(self) -> str:
+        return await self._call("iota_getProtocolVersion")
+
+    async def get_events(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._call("iota_getEvents", [query])
+
+    async def query_events(self, query: Dict[str, Any], cursor: Optional[Dict[str, Any]] = None, limit: int = 50, descending: bool = False) -> Dict[str, Any]:
+        return await self._call("iotax_queryEvents", [query, cursor, limit, descending])
+
+    async def query_transaction_blocks(self, query: Dict[str, Any], cursor: Optional[str] = None, limit: int = 50, descending: bool = False) -> Dict[str, Any]:
+        return await self._call("iotax_queryTransactionBlocks", [query, cursor, limit, descending])
+
+    def iter_coins(self, address: str, coin_type: str = "0x2::iota::IOTA", limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        return _aiter_pages(lambda cursor: self.get_coins(address, coin_type, cursor, limit))
+
+    def iter_owned_objects(self, address: str, query: Optional[Dict[str, Any]] = None, limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        return _aiter_pages(lambda cursor: self.get_owned_objects(address, query, cursor, limit))
+
+    def iter_events(self, query: Dict[str, Any], limit: int = 50, descending: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        return _aiter_pages(lambda cursor: self.query_events(query, cursor, limit, descending))
+
+    def iter_transaction_blocks(self, query: Dict[str, Any], limit: int = 50, descending: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        return _aiter_pages(lambda cursor: self.query_transaction_blocks(query, cursor, limit, descending))
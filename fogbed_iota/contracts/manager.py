@@ -1,8 +1,10 @@
+import io
 import os
 import re
 import shlex
 import subprocess
-from typing import Any, Dict, List, Optional
+import tarfile
+from typing import Any, Dict, List, Optional, Tuple
 
 from fogbed_iota.utils import get_logger
 from fogbed_iota.utils.parser import extract_json_from_output, tx_digest, tx_looks_successful
@@ -11,6 +13,23 @@ from fogbed_iota.contracts.raw_executor import RawExecutor
 
 logger = get_logger("contracts.manager")
 
+COPY_TIMEOUT = 30
+
+
+def _tree_signature(root: str) -> Tuple:
+    """
+    Assinatura barata de uma árvore de arquivos: caminho relativo, tamanho e
+    mtime de cada arquivo. Qualquer edição muda a assinatura.
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            entries.append((os.path.relpath(path, root), st.st_size, st.st_mtime_ns))
+    return tuple(entries)
+
 
 class SmartContractManager:
     """
@@ -35,6 +54,8 @@ class SmartContractManager:
         self.deployed_packages: Dict[str, MovePackage] = {}
         self.contracts_dir = "/contracts"
         self.executor = RawExecutor(self.client)
+        # (container_id, container_path) -> assinatura do diretório local já copiado
+        self._copied_packages: Dict[Tuple[str, str], Tuple] = {}
 
         logger.info("SmartContractManager initialized")
 
@@ -109,22 +130,37 @@ class SmartContractManager:
             raise FileNotFoundError(f"Move.toml not found in {local_path}")
 
         container_path = f"{self.contracts_dir}/{package_name}"
-        self.client.cmd(f"mkdir -p {shlex.quote(container_path)}")
-
         container_id = self.executor.resolve_container_id()
+        cache_key = (container_id, container_path)
+        signature = _tree_signature(local_path)
+        if self._copied_packages.get(cache_key) == signature:
+            logger.info(f"✅ Package unchanged since last copy, skipping ({container_path})")
+            return container_path
 
-        tar_cmd = (
-            f"tar -C {shlex.quote(local_path)} -cf - . | "
-            f"docker exec -i {container_id} tar -C {shlex.quote(container_path)} -xf -"
-        )
+        self.client.cmd(f"mkdir -p {shlex.quote(container_path)}")
+
+        # O tar é montado uma vez só e reaproveitado pelo fallback, sem
+        # percorrer o diretório de novo
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            tar.add(local_path, arcname=".")
+        tar_bytes = buf.getvalue()
 
-        tar_result = subprocess.run(tar_cmd, shell=True, check=False)
-        if tar_result.returncode != 0:
-            logger.warning(f"tar method failed with code {tar_result.returncode}, trying docker cp")
-            cp_cmd = f"docker cp {shlex.quote(local_path)}/. {container_id}:{container_path}/"
-            cp_result = subprocess.run(cp_cmd, shell=True, check=False)
-            if cp_result.returncode != 0:
-                raise RuntimeError(f"Failed to copy package (tar exit: {tar_result.returncode}, cp exit: {cp_result.returncode})")
+        try:
+            tar_result = subprocess.run(
+                ["docker", "exec", "-i", container_id, "tar", "-C", container_path, "-xf", "-"],
+                input=tar_bytes, capture_output=True, timeout=COPY_TIMEOUT, check=False,
+            )
+            if tar_result.returncode != 0:
+                logger.warning(f"tar method failed with code {tar_result.returncode}, trying docker cp")
+                cp_result = subprocess.run(
+                    ["docker", "cp", "-", f"{container_id}:{container_path}"],
+                    input=tar_bytes, capture_output=True, timeout=COPY_TIMEOUT, check=False,
+                )
+                if cp_result.returncode != 0:
+                    raise RuntimeError(f"Failed to copy package (tar exit: {tar_result.returncode}, cp exit: {cp_result.returncode})")
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(f"Package copy timed out after {COPY_TIMEOUT}s ({' '.join(e.cmd[:2])})") from e
 
         verify_cmd = f"test -f {shlex.quote(container_path)}/Move.toml && echo 'OK' || echo 'MISSING'"
         verify_result = self.client.cmd(verify_cmd)
@@ -132,6 +168,7 @@ class SmartContractManager:
         if "MISSING" in verify_result:
             raise RuntimeError(f"Copy reported success but Move.toml not found in container at {container_path}")
 
+        self._copied_packages[cache_key] = signature
         logger.info(f"✅ Package copied to {container_path}")
         return container_path
 
@@ -140,21 +177,24 @@ class SmartContractManager:
         package_path = package_path.rstrip("/")
         move_toml_path = f"{package_path}/Move.toml"
 
-        check_cmd = f"test -f {shlex.quote(move_toml_path)} && echo 'OK' || echo 'NOT_FOUND'"
-        raw_check = self.client.cmd(check_cmd)
-        check = raw_check.strip()
-
-        if "OK" not in check or "NOT_FOUND" in check:
-            raise FileNotFoundError(f"Move.toml not found in {package_path}.")
-
-        build_cmd = f"cd {shlex.quote(package_path)} && iota move build 2>&1"
+        # Checagem do Move.toml, build e código de saída num único round-trip;
+        # o subshell evita mudar o diretório do shell persistente do container
+        build_cmd = (
+            f"if [ -f {shlex.quote(move_toml_path)} ]; then "
+            f"(cd {shlex.quote(package_path)} && iota move build 2>&1); "
+            f"echo \"BUILD_RC=$?\"; "
+            f"else echo 'NOT_FOUND'; fi"
+        )
         output = self.client.cmd(build_cmd)
 
-        status_cmd = f"cd {shlex.quote(package_path)} && iota move build >/dev/null 2>&1 && echo 'OK' || echo 'FAIL'"
-        raw_status = self.client.cmd(status_cmd)
-        status = raw_status.strip()
+        rc_match = re.search(r"BUILD_RC=(\d+)\s*$", output)
+        if not rc_match:
+            if "NOT_FOUND" in output:
+                raise FileNotFoundError(f"Move.toml not found in {package_path}.")
+            raise RuntimeError(f"Move build produced no exit status.\n{output[-1000:]}")
 
-        if "OK" not in status or "FAIL" in status:
+        output = output[:rc_match.start()]
+        if rc_match.group(1) != "0":
             raise RuntimeError(f"Move build failed. Check package syntax.\n{output[:1000]}")
 
         modules = self.executor.extract_modules_from_build(package_path)
@@ -183,8 +223,7 @@ class SmartContractManager:
         balance = 0
         if self.cli:
             try:
-                coins = self.cli.get_gas(account.address)
-                balance = sum(int(c.get("balance", 0)) for c in coins)
+                balance = self.cli.get_balance(account.address)
             except Exception:
                 balance = self._get_balance(sender_alias)
         else:
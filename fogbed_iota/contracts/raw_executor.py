@@ -1,9 +1,13 @@
 import os
+import re
 import shlex
 import subprocess
 from typing import Any, Dict, List, Optional
 
+from docker.errors import DockerException
+
 from fogbed_iota.utils import get_logger
+from fogbed_iota.utils.docker_client import get_docker_client
 from fogbed_iota.utils.parser import extract_json_from_output, tx_looks_successful, tx_error
 
 logger = get_logger("contracts.raw_executor")
@@ -13,13 +17,36 @@ class RawExecutor:
     
     def __init__(self, client_container):
         self.client = client_container
+        self._container_id: Optional[str] = None
 
     def resolve_container_id(self) -> str:
+        # O id não muda durante a vida do container: resolve uma vez só
+        if self._container_id is None:
+            self._container_id = self._lookup_container_id()
+        return self._container_id
+
+    def invalidate_container_id(self) -> None:
+        """Esquece o id em cache (ex.: container recriado)."""
+        self._container_id = None
+
+    def _lookup_container_id(self) -> str:
+        docker_client = get_docker_client()
+        if docker_client is not None:
+            # containers.get casa o nome exato, sem filtro nem fork do CLI
+            try:
+                return docker_client.containers.get(f"mn.{self.client.name}").id
+            except DockerException:
+                return f"mn.{self.client.name}"
+        # Filtro ancorado: 'name=client' também casaria com client2, mn.client-old...
+        name_filter = f"name=^/?{re.escape(f'mn.{self.client.name}')}$"
         try:
-            cmd = f"docker ps --filter 'name={self.client.name}' --format '{{{{.ID}}}}'"
-            container_id = subprocess.check_output(cmd, shell=True, text=True).strip()
-            if container_id:
-                return container_id
+            out = subprocess.check_output(
+                ["docker", "ps", "--filter", name_filter, "--format", "{{.ID}}"],
+                text=True,
+            )
+            ids = out.split()
+            if ids:
+                return ids[0]
         except Exception:
             pass
         return f"mn.{self.client.name}"
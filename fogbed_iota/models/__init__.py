@@ -10,6 +10,7 @@ from .iota_node import (
     IotaNodeMetadata,
     ValidatorNode,
     FullnodeNode,
+    NodePool,
     create_validator,
     create_fullnode,
 )
@@ -20,6 +21,7 @@ __all__ = [
     'IotaNodeMetadata',
     'ValidatorNode',
     'FullnodeNode',
+    'NodePool',
     'create_validator',
     'create_fullnode',
 ]
@@ -8,8 +8,9 @@ e subtipos operacionais alinhados à arquitetura da rede IOTA.
 """
 
 import os
+import time
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Union
 from enum import Enum
 
 from fogbed import Container
@@ -53,6 +54,14 @@ class NodeType(Enum):
         return self.value
 
 
+# Lookup direto por valor, sem passar pelo Enum.__call__ a cada config
+_ROLE_BY_VALUE: Dict[str, NodeRole] = {r.value: r for r in NodeRole}
+_NODE_TYPE_BY_VALUE: Dict[str, NodeType] = {t.value: t for t in NodeType}
+
+# Campos de init aceitos por IotaNodeConfig.from_dict além de name/ip
+_FROM_DICT_OPTIONAL_KEYS = ("role", "node_type", "port_offset", "image")
+
+
 @dataclass
 class IotaNodeConfig:
     """
@@ -92,7 +101,7 @@ class IotaNodeConfig:
 
     def _validate(self) -> None:
         """Valida configuração do nó"""
-        logger.debug(f"Validating node config: {self.name}")
+        logger.debug("Validating node config: %s", self.name)
 
         # Validar nome
         if not validate_container_name(self.name):
@@ -104,17 +113,17 @@ class IotaNodeConfig:
 
         # Validar role (string → enum)
         if not isinstance(self.role, NodeRole):
-            try:
-                self.role = NodeRole(self.role)
-            except ValueError:
+            role = _ROLE_BY_VALUE.get(self.role) if isinstance(self.role, str) else None
+            if role is None:
                 raise ValueError(f"Invalid role: {self.role}")
+            self.role = role
 
         # Validar node_type (string → enum)
         if isinstance(self.node_type, str):
-            try:
-                self.node_type = NodeType(self.node_type)
-            except ValueError:
+            node_type = _NODE_TYPE_BY_VALUE.get(self.node_type)
+            if node_type is None:
                 raise ValueError(f"Invalid node_type: {self.node_type}")
+            self.node_type = node_type
 
         # Ajustar role com base no node_type (se definido)
         if self.node_type:
@@ -134,7 +143,7 @@ class IotaNodeConfig:
         if not isinstance(self.port_offset, int) or self.port_offset < 0:
             raise ValueError(f"Invalid port_offset: {self.port_offset}")
 
-        logger.debug(f"✅ Node config validated: {self.name}")
+        logger.debug("✅ Node config validated: %s", self.name)
 
     def _compute_ports(self) -> None:
         """Calcula portas baseado no offset - TODOS os ports variam"""
@@ -154,10 +163,24 @@ class IotaNodeConfig:
             raise ValueError(f"Invalid Metrics port: {self.metrics_port}")
 
         logger.debug(
-            f"Ports computed for {self.name}: "
-            f"P2P={self.p2p_port}, RPC={self.rpc_port}, Metrics={self.metrics_port}"
+            "Ports computed for %s: P2P=%s, RPC=%s, Metrics=%s",
+            self.name, self.p2p_port, self.rpc_port, self.metrics_port,
         )
 
+    # Endereços derivados: properties (e não campos) para seguirem ip/portas
+    # e ficarem fora de fields()/asdict()/__eq__
+    @property
+    def p2p_multiaddr(self) -> str:
+        return f"/ip4/{self.ip}/udp/{self.p2p_port}"
+
+    @property
+    def rpc_url(self) -> str:
+        return f"http://{self.ip}:{self.rpc_port}"
+
+    @property
+    def metrics_url(self) -> str:
+        return f"http://{self.ip}:{self.metrics_port}/metrics"
+
     def to_dict(self) -> Dict[str, Any]:
         """Converte config para dicionário"""
         return {
@@ -182,24 +205,11 @@ class IotaNodeConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "IotaNodeConfig":
         """Cria config a partir de dicionário"""
-        logger.debug(f"Creating IotaNodeConfig from dict: {data}")
-
-        role = data.get("role", NodeRole.VALIDATOR)
-        if isinstance(role, str):
-            role = NodeRole(role)
-
-        node_type = data.get("node_type")
-        if isinstance(node_type, str):
-            node_type = NodeType(node_type)
-
-        return cls(
-            name=data["name"],
-            ip=data["ip"],
-            role=role,
-            node_type=node_type,
-            port_offset=data.get("port_offset", 0),
-            image=data.get("image", "iota-dev:latest"),
-        )
+        logger.debug("Creating IotaNodeConfig from dict: %s", data)
+        # Strings de role/node_type são convertidas em __post_init__; chaves
+        # ausentes ficam com os defaults dos próprios campos
+        optional = {key: data[key] for key in _FROM_DICT_OPTIONAL_KEYS if key in data}
+        return cls(name=data["name"], ip=data["ip"], **optional)
 
 
 @dataclass
@@ -227,11 +237,9 @@ class IotaNodeMetadata:
 
     def __post_init__(self):
         """Inicializa metadados"""
-        import time
-
         self.container_name = f"mn.{self.config.name}"
         self.created_at = time.time()
-        logger.debug(f"Metadata created for {self.container_name}")
+        logger.debug("Metadata created for %s", self.container_name)
 
     def is_validator(self) -> bool:
         """Verifica se é validador"""
@@ -263,7 +271,7 @@ class IotaNodeMetadata:
                 f"(error: {error})"
             )
         else:
-            logger.info(f"Node {self.config.name} status: {old_status} → {status}")
+            logger.info("Node %s status: %s → %s", self.config.name, old_status, status)
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte metadados para dicionário"""
@@ -299,11 +307,11 @@ class ValidatorNode:
         if self.config.role != NodeRole.VALIDATOR:
             raise ValueError(f"Expected validator role, got {self.config.role}")
         self.metadata = IotaNodeMetadata.from_config(self.config)
-        logger.info(f"ValidatorNode created: {self.config.name}")
+        logger.info("ValidatorNode created: %s", self.config.name)
 
     def get_p2p_address(self) -> str:
         """Retorna endereço P2P (multiaddr format)"""
-        return f"/ip4/{self.config.ip}/udp/{self.config.p2p_port}"
+        return self.config.p2p_multiaddr
 
     def get_rpc_endpoint(self) -> Optional[str]:
         """Retorna endpoint RPC (validadores normalmente não expõem)"""
@@ -311,7 +319,7 @@ class ValidatorNode:
 
     def get_metrics_endpoint(self) -> str:
         """Retorna endpoint de métricas"""
-        return f"http://{self.config.ip}:{self.config.metrics_port}/metrics"
+        return self.config.metrics_url
 
     def get_consensus_db_path(self) -> str:
         """Retorna caminho do consensus database"""
@@ -342,19 +350,19 @@ class FullnodeNode:
         if self.config.role != NodeRole.FULLNODE:
             raise ValueError(f"Expected fullnode role, got {self.config.role}")
         self.metadata = IotaNodeMetadata.from_config(self.config)
-        logger.info(f"FullnodeNode created: {self.config.name} (gateway)")
+        logger.info("FullnodeNode created: %s (gateway)", self.config.name)
 
     def get_p2p_address(self) -> str:
         """Retorna endereço P2P (multiaddr format)"""
-        return f"/ip4/{self.config.ip}/udp/{self.config.p2p_port}"
+        return self.config.p2p_multiaddr
 
     def get_rpc_endpoint(self) -> str:
         """Retorna endpoint RPC"""
-        return f"http://{self.config.ip}:{self.config.rpc_port}"
+        return self.config.rpc_url
 
     def get_metrics_endpoint(self) -> str:
         """Retorna endpoint de métricas Prometheus"""
-        return f"http://{self.config.ip}:{self.config.metrics_port}/metrics"
+        return self.config.metrics_url
 
     def get_db_path(self) -> str:
         """Retorna caminho do application database"""
@@ -369,6 +377,33 @@ class FullnodeNode:
         }
 
 
+class NodePool:
+    """
+    Visão em colunas (listas paralelas) de um conjunto de nós
+
+    Montada uma vez; loops de monitoramento iteram/zipam as listas direto,
+    sem percorrer os objetos e formatar endereços a cada passada.
+    """
+
+    __slots__ = ("names", "ips", "roles", "p2p_addrs", "rpc_urls", "metrics_urls")
+
+    def __init__(self, nodes: Iterable[Union[ValidatorNode, FullnodeNode]]):
+        nodes = list(nodes)
+        self.names: List[str] = [n.config.name for n in nodes]
+        self.ips: List[str] = [n.config.ip for n in nodes]
+        self.roles: List[NodeRole] = [n.config.role for n in nodes]
+        self.p2p_addrs: List[str] = [n.get_p2p_address() for n in nodes]
+        self.rpc_urls: List[Optional[str]] = [n.get_rpc_endpoint() for n in nodes]
+        self.metrics_urls: List[str] = [n.get_metrics_endpoint() for n in nodes]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rpc_endpoints(self) -> List[str]:
+        """Endpoints RPC expostos (validadores não expõem RPC)"""
+        return [url for url in self.rpc_urls if url is not None]
+
+
 DEFAULT_IMAGE = os.getenv("IOTA_DOCKER_IMAGE", "iota-dev:latest")
 
 class IotaNode(Container):
@@ -401,7 +436,7 @@ class IotaNode(Container):
             "NODE_TYPE": role,
         }
 
-        logger.debug(f"Creating IotaNode {name} ({role}) @ {ip}")
+        logger.debug("Creating IotaNode %s (%s) @ %s", name, role, ip)
 
         super().__init__(
             name=name,
@@ -11,7 +11,8 @@ import json
 import atexit
 import signal
 import sys
-from typing import List, Optional, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 from fogbed import Container, FogbedExperiment
 from fogbed_iota.utils import get_logger
@@ -20,7 +21,7 @@ from fogbed_iota.utils import get_logger
 from fogbed_iota.models.iota_node import IotaNode
 from fogbed_iota.utils.genesis import ensure_iota_binary, generate_genesis
 from fogbed_iota.utils.config import prepare_configs
-from fogbed_iota.utils.lifecycle import inject_and_boot, wait_for_network_ready
+from fogbed_iota.utils.lifecycle import inject_and_boot, parallel_map, push_directory, wait_for_network_ready
 
 if TYPE_CHECKING:
     from fogbed_iota.accounts import AccountManager
@@ -28,11 +29,25 @@ if TYPE_CHECKING:
 
 logger = get_logger('network')
 
-WORK_DIR = "/tmp/fogbed_iota_workdir"
+# Aponte para um tmpfs (ex.: /dev/shm/fogbed_iota_workdir) para manter genesis e YAMLs em RAM
+WORK_DIR = os.getenv("FOGBED_IOTA_WORKDIR", "/tmp/fogbed_iota_workdir")
 GENESIS_DIR = os.path.join(WORK_DIR, "genesis")
 LIVE_DATA_DIR = os.path.join(WORK_DIR, "live_data")
 DEFAULT_IMAGE = os.getenv("IOTA_DOCKER_IMAGE", "iota-dev:latest")
 
+# Esquema fixo: renderizado com str.format, sem passar pelo PyYAML
+_CLIENT_YAML_TEMPLATE = """---
+keystore:
+  File: /app/config/iota.keystore
+envs:
+  - alias: localnet
+    rpc: "{rpc_url}"
+    ws: ~
+    basic_auth: ~
+    faucet: ~
+active_env: localnet
+"""
+
 
 class IotaNetwork:
     """Orquestrador principal da rede IOTA."""
@@ -52,6 +67,7 @@ class IotaNetwork:
         self.client_container: Optional[Container] = None
         self._iota_binary_path: Optional[str] = None
         self._iota_version: Optional[str] = None
+        self._binary_future: Optional[Future] = None
         self._cleanup_registered = False
         self.account_manager: Optional["AccountManager"] = None
         self.contract_manager: Optional["SmartContractManager"] = None
@@ -80,16 +96,19 @@ class IotaNetwork:
 
     def stop(self) -> None:
         logger.info("🛑 Stopping IOTA Network...")
-        for node in self.nodes:
-            try:
-                node.cmd("pkill -9 iota-node 2>/dev/null || true")
-                logger.debug(f"Stopped {node.name}")
-            except Exception as e:
-                logger.warning(f"Failed to stop {node.name}: {e}")
+        parallel_map(self._stop_node, self.nodes)
         if self.auto_cleanup:
             self._cleanup_work_dir()
         logger.info("✅ IOTA Network stopped")
 
+    @staticmethod
+    def _stop_node(node: IotaNode) -> None:
+        try:
+            node.cmd("pkill -9 iota-node 2>/dev/null || true")
+            logger.debug(f"Stopped {node.name}")
+        except Exception as e:
+            logger.warning(f"Failed to stop {node.name}: {e}")
+
     def _cleanup_work_dir(self) -> None:
         if os.path.exists(WORK_DIR):
             try:
@@ -113,6 +132,10 @@ class IotaNetwork:
         logger.debug(f"✅ Validator {name} added (P2P: {node.p2p_port})")
         return node
 
+    def add_validators(self, specs: Iterable[Tuple[str, str]]) -> List[IotaNode]:
+        """Adiciona vários validadores de uma vez a partir de pares (name, ip)."""
+        return [self.add_validator(name, ip) for name, ip in specs]
+
     def add_gateway(self, name: str, ip: str) -> IotaNode:
         logger.info(f"Adding gateway (fullnode): {name} @ {ip}")
         node = IotaNode(name=name, ip=ip, role="fullnode", port_offset=len(self.nodes), image=self.image)
@@ -124,8 +147,18 @@ class IotaNetwork:
         logger.info(f"Setting client container: {container.name}")
         self.client_container = container
 
+    def _prefetch_binary(self) -> None:
+        """Inicia a resolução/extração do binário iota em background (idempotente)."""
+        if self._binary_future is not None:
+            return
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._binary_future = executor.submit(ensure_iota_binary, self.image, self._iota_binary_path)
+        executor.shutdown(wait=False)
+
     def attach_to_experiment(self, datacenter_name: str = "cloud") -> None:
         logger.info(f"Attaching nodes to datacenter: {datacenter_name}")
+        # A extração do binário da imagem roda enquanto o usuário faz exp.start()
+        self._prefetch_binary()
         try:
             cloud = self.exp.get_virtual_instance(datacenter_name)
         except Exception:
@@ -145,9 +178,14 @@ class IotaNetwork:
         logger.info("=" * 60)
         logger.info("Starting IOTA Network Initialization")
         logger.info("=" * 60)
+        # Resolver/extrair o binário (docker create/cp) não depende do work dir:
+        # roda em paralelo com a limpeza (ou já começou em attach_to_experiment)
+        self._prefetch_binary()
         self._cleanup()
-        
-        self._iota_binary_path = ensure_iota_binary(self.image, self._iota_binary_path)
+        try:
+            self._iota_binary_path = self._binary_future.result()
+        finally:
+            self._binary_future = None
         
         validators = [n for n in self.nodes if n.role == "validator"]
         generate_genesis(validators, GENESIS_DIR, self._iota_binary_path)
@@ -182,40 +220,40 @@ class IotaNetwork:
         rpc_node = next((n for n in self.nodes if n.role == "fullnode"), self.nodes[0] if self.nodes else None)
         if not rpc_node:
             raise RuntimeError("No nodes available for client configuration")
-        self.client_container.cmd("mkdir -p /app/config /root/.iota /root/.iota/iota_config")
+        # Keystore e client.yaml vão juntos num único stream tar (docker cp -),
+        # sem heredoc passando pelo pty do Mininet
+        client_dir = os.path.join(WORK_DIR, "client")
+        os.makedirs(client_dir, exist_ok=True)
         benchmark_keystore = os.path.join(GENESIS_DIR, "benchmark.keystore")
         default_keystore = os.path.join(GENESIS_DIR, "iota.keystore")
         host_keystore = benchmark_keystore if os.path.exists(benchmark_keystore) else default_keystore
-        if not os.path.exists(host_keystore):
+        has_keystore = os.path.exists(host_keystore)
+        if not has_keystore:
             logger.warning("⚠️ No genesis keystore found, client may not have funds")
         else:
-            cmd_cp = f"docker cp {host_keystore} mn.{self.client_container.name}:/app/config/iota.keystore"
-            rc = os.system(cmd_cp)
-            if rc != 0:
-                raise RuntimeError(f"Failed to copy keystore to client (rc={rc})")
-            self.client_container.cmd("cp -f /app/config/iota.keystore /root/.iota/iota.keystore")
-            logger.debug(f"✅ Genesis keystore copied from {os.path.basename(host_keystore)}")
+            shutil.copyfile(host_keystore, os.path.join(client_dir, "iota.keystore"))
         rpc_url = f"http://{rpc_node.ip_addr}:{rpc_node.rpc_port}"
-        yaml_content = f"""---
-keystore:
-  File: /app/config/iota.keystore
-envs:
-  - alias: localnet
-    rpc: "{rpc_url}"
-    ws: ~
-    basic_auth: ~
-    faucet: ~
-active_env: localnet
-"""
-        self.client_container.cmd(f"cat > /app/config/client.yaml << 'EOF'\n{yaml_content}\nEOF")
-        self.client_container.cmd("cp -f /app/config/client.yaml /root/.iota/iota_config/client.yaml")
+        yaml_content = _CLIENT_YAML_TEMPLATE.format(rpc_url=rpc_url)
+        with open(os.path.join(client_dir, "client.yaml"), "w", encoding="utf-8") as f:
+            f.write(yaml_content + "\n")
+        push_directory(self.client_container.name, client_dir, "/app/config")
+        install_cmd = (
+            "mkdir -p /root/.iota/iota_config"
+            " && cp -f /app/config/client.yaml /root/.iota/iota_config/client.yaml"
+        )
+        if has_keystore:
+            install_cmd += " && cp -f /app/config/iota.keystore /root/.iota/iota.keystore"
+        self.client_container.cmd(install_cmd)
+        if has_keystore:
+            logger.debug(f"✅ Genesis keystore copied from {os.path.basename(host_keystore)}")
         validate_cmd = 'python3 -c "import yaml; yaml.safe_load(open(\'/app/config/client.yaml\'))" 2>&1'
         validate_result = self.client_container.cmd(validate_cmd)
-        if "error" in validate_result.lower() or "exception" in validate_result.lower():
+        validate_lower = validate_result.lower()
+        if "error" in validate_lower or "exception" in validate_lower:
             logger.error(f"❌ Generated client.yaml is invalid:\n{validate_result}")
             raise RuntimeError("Invalid client.yaml generated")
         logger.debug("✅ client.yaml validated")
-        self.client_container.cmd("sh -lc 'iota client --client.config /app/config/client.yaml envs 2>&1 || true'")
+        self.client_container.cmd("iota client --client.config /app/config/client.yaml envs 2>&1 || true")
         logger.info(f"✅ Client configured (RPC: {rpc_url})")
 
     def _setup_smart_contract_env(self) -> None:
@@ -229,7 +267,7 @@ active_env: localnet
             from fogbed_iota.contracts import SmartContractManager
             
             cli = IotaCLI(self.client_container)
-            self.account_manager = AccountManager(self.client_container)
+            self.account_manager = AccountManager(self.client_container, cli=cli)
             self.contract_manager = SmartContractManager(cli, self.account_manager)
             
             logger.info("✅ SmartContractManager created with IotaCLI integration")
@@ -278,8 +316,7 @@ active_env: localnet
     @classmethod
     def create_network(cls, experiment: FogbedExperiment, validators: int = 4, gateways: int = 1, image: str = DEFAULT_IMAGE) -> "IotaNetwork":
         net = cls(experiment, image=image, auto_cleanup=True)
-        for i in range(1, validators + 1):
-            net.add_validator(f"validator{i}", f"10.0.0.{i}")
+        net.add_validators((f"validator{i}", f"10.0.0.{i}") for i in range(1, validators + 1))
         for i in range(gateways):
             net.add_gateway(f"gateway{i+1}", f"10.0.0.{100+i}")
         return net
@@ -1,25 +1,97 @@
 import os
+import pickle
 import shutil
-import glob
 import re
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
 
 from fogbed_iota.utils import get_logger
 from fogbed_iota.models.iota_node import IotaNode
 
 logger = get_logger('config')
 
+# Usa o parser/emitter em C (libyaml) quando disponível
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# path -> ((st_mtime_ns, st_size), dados parseados serializados com pickle)
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _load_yaml_cached(path: str) -> Any:
+    """
+    Carrega um YAML uma única vez por versão do arquivo (mtime + tamanho).
+    Retorna uma cópia nova a cada chamada, pois os chamadores alteram o
+    resultado; ``pickle.loads`` clona bem mais rápido que ``copy.deepcopy``.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "r") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        # O objeto recém-parseado não fica no cache: pode ir direto ao chamador
+        _YAML_CACHE[path] = (key, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+        return data
+    logger.debug("YAML cache hit: %s", path)
+    return pickle.loads(cached[1])
+
+
+# Parte fixa da config do gateway; só os seed-peers variam com a topologia
+_GATEWAY_YAML_TEMPLATE = """---
+db-path: "/app/db"
+network-address: /ip4/0.0.0.0/tcp/8080/http
+metrics-address: "0.0.0.0:9184"
+
+json-rpc-address: "0.0.0.0:9000"
+
+genesis:
+  genesis-file-location: "/custom_config/genesis.blob"
+
+p2p-config:
+  listen-address: "0.0.0.0:{p2p_port}"
+  external-address: /ip4/{ip}/udp/{p2p_port}/quic
+  seed-peers:"""
+
+# Templates do genesis que não são configs de validador
+_NON_VALIDATOR_YAML_RE = re.compile(r"client|iota_config|fullnode|network")
+
+# Diretórios que nunca contêm templates YAML do genesis
+_SCAN_PRUNE_DIRS = frozenset({"target", "node_modules", "__pycache__"})
+
+
+def _scan_yaml_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Percorre ``root`` recursivamente com ``os.scandir`` e gera as entradas
+    (``DirEntry``) de arquivos ``*.y*ml``. Diretórios ocultos e ``_SCAN_PRUNE_DIRS`` são podados
+    (mesma semântica de ``glob(recursive=True)`` para entradas ocultas).
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _SCAN_PRUNE_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith((".yaml", ".yml")):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Could not scan {current}: {e}")
+
 
 def patch_genesis_network_yaml(network_yaml: str, validators: List[IotaNode]) -> None:
-    import yaml as _yaml
     with open(network_yaml, "r") as f:
-        content = f.read()
-    
-    try:
-        data = _yaml.safe_load(content)
-    except Exception as e:
-        logger.warning(f"Could not parse network.yaml as YAML: {e}")
-        return
+        try:
+            data = yaml.load(f, Loader=_YamlLoader)
+        except Exception as e:
+            logger.warning(f"Could not parse network.yaml as YAML: {e}")
+            return
     
     validator_configs = data.get("validator_configs", [])
     if not validator_configs:
@@ -32,92 +104,116 @@ def patch_genesis_network_yaml(network_yaml: str, validators: List[IotaNode]) ->
             port_match = re.search(r'/tcp/(\d+)', old_net_addr)
             port = port_match.group(1) if port_match else "8080"
             cfg["network-address"] = f"/ip4/{node.ip_addr}/tcp/{port}/http"
-            logger.debug(f"Validator {i}: network-address {old_net_addr} → {cfg['network-address']}")
+            logger.debug("Validator %s: network-address %s → %s", i, old_net_addr, cfg['network-address'])
         
         p2p = cfg.get("p2p-config", {})
         if p2p:
             p2p["listen-address"] = f"0.0.0.0:{node.p2p_port}"
             p2p["external-address"] = f"/ip4/{node.ip_addr}/udp/{node.p2p_port}/quic"
-    
+
     with open(network_yaml, "w") as f:
-        _yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
     
     logger.info(f"✅ network.yaml patched for {len(validators)} validators")
 
 
-def patch_validator_yaml(source: str, dest: str, node: IotaNode, all_validators: List[IotaNode]) -> None:
-    logger.debug(f"Patching validator YAML: {source} → {dest}")
-    with open(source, "r") as f:
-        lines = f.readlines()
-    new_lines: List[str] = []
-    for line in lines:
-        if "db-path:" in line:
-            indent = " " * (len(line) - len(line.lstrip()))
-            new_lines.append(f'{indent}db-path: "/app/db"\n')
-        elif "genesis-file-location:" in line:
-            indent = " " * (len(line) - len(line.lstrip()))
-            new_lines.append(f'{indent}genesis-file-location: "/custom_config/genesis.blob"\n')
-        elif "network-address:" in line:
-            indent = " " * (len(line) - len(line.lstrip()))
-            port_match = re.search(r'/tcp/(\d+)', line)
-            if port_match:
-                net_port = port_match.group(1)
-            else:
-                net_port = str(2000 + all_validators.index(node) * 10)
-            new_lines.append(f"{indent}network-address: /ip4/0.0.0.0/tcp/{net_port}/http\n")
-        elif "metrics-address:" in line:
-            indent = " " * (len(line) - len(line.lstrip()))
-            new_lines.append(f'{indent}metrics-address: "0.0.0.0:9184"\n')
-        elif "listen-address:" in line and "p2p" not in line.lower():
-            indent = " " * (len(line) - len(line.lstrip()))
-            new_lines.append(f'{indent}listen-address: "0.0.0.0:{node.p2p_port}"\n')
-        elif "external-address:" in line:
-            indent = " " * (len(line) - len(line.lstrip()))
-            new_lines.append(f'{indent}external-address: /ip4/{node.ip_addr}/udp/{node.p2p_port}/quic\n')
-        elif any(k in line for k in ["pruning-period", "num-epochs-to-retain"]):
-            continue
-        else:
-            new_lines.append(line)
+# Chaves de poda removidas das configs de validador (em qualquer nível)
+_DROPPED_VALIDATOR_KEYS = ("pruning-period", "num-epochs-to-retain")
+
+
+def _drop_keys(data, keys) -> None:
+    if isinstance(data, dict):
+        for key in keys:
+            data.pop(key, None)
+        for value in data.values():
+            _drop_keys(value, keys)
+    elif isinstance(data, list):
+        for value in data:
+            _drop_keys(value, keys)
+
+
+def patch_validator_yaml(
+    source: str,
+    dest: str,
+    node: IotaNode,
+    all_validators: List[IotaNode],
+    peer_ids: Optional[List[str]] = None,
+) -> None:
+    logger.debug("Patching validator YAML: %s → %s", source, dest)
+    cfg = _load_yaml_cached(source)
+    if not isinstance(cfg, dict):
+        raise RuntimeError(f"Validator template is not a YAML mapping: {source}")
+
+    cfg["db-path"] = "/app/db"
+    consensus = cfg.get("consensus-config")
+    if isinstance(consensus, dict) and "db-path" in consensus:
+        consensus["db-path"] = "/app/consensus_db"
+
+    genesis = cfg.get("genesis")
+    if not isinstance(genesis, dict):
+        genesis = cfg["genesis"] = {}
+    genesis["genesis-file-location"] = "/custom_config/genesis.blob"
+
+    port_match = re.search(r'/tcp/(\d+)', str(cfg.get("network-address", "")))
+    if port_match:
+        net_port = port_match.group(1)
+    else:
+        net_port = str(2000 + all_validators.index(node) * 10)
+    cfg["network-address"] = f"/ip4/0.0.0.0/tcp/{net_port}/http"
+    cfg["metrics-address"] = "0.0.0.0:9184"
+
+    p2p = cfg.get("p2p-config")
+    if isinstance(p2p, dict):
+        p2p["listen-address"] = f"0.0.0.0:{node.p2p_port}"
+        p2p["external-address"] = f"/ip4/{node.ip_addr}/udp/{node.p2p_port}/quic"
+        # Lista estática dos outros validadores: a malha fecha no boot, sem esperar o discovery
+        if not p2p.get("seed-peers"):
+            seeds = []
+            for i, v in enumerate(all_validators):
+                if v is node:
+                    continue
+                seed = {"address": f"/ip4/{v.ip_addr}/udp/{v.p2p_port}/quic"}
+                if peer_ids and i < len(peer_ids):
+                    seed = {"peer-id": peer_ids[i], **seed}
+                seeds.append(seed)
+            if seeds:
+                p2p["seed-peers"] = seeds
+
+    _drop_keys(cfg, _DROPPED_VALIDATOR_KEYS)
+
     with open(dest, "w") as f:
-        f.writelines(new_lines)
-    logger.debug(f"✅ Validator YAML patched for {node.name}")
+        yaml.dump(cfg, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+    logger.debug("✅ Validator YAML patched for %s", node.name)
 
 
 def extract_peer_ids(genesis_dir: str) -> List[str]:
-    peer_ids = []
     fullnode_yaml = os.path.join(genesis_dir, "fullnode.yaml")
     if os.path.exists(fullnode_yaml):
-        with open(fullnode_yaml, "r") as f:
-            content = f.read()
-        matches = re.findall(r'peer-id:\s*([a-f0-9]{64})', content)
+        # Os seed-peers já vêm estruturados no YAML: lê do dict em vez de regex no texto
+        try:
+            data = _load_yaml_cached(fullnode_yaml)
+        except yaml.YAMLError as e:
+            logger.warning(f"Could not parse {fullnode_yaml}: {e}")
+            data = None
+        p2p = data.get("p2p-config") if isinstance(data, dict) else None
+        seeds = p2p.get("seed-peers") if isinstance(p2p, dict) else None
+        matches = [
+            str(peer["peer-id"]) for peer in seeds or []
+            if isinstance(peer, dict) and peer.get("peer-id")
+        ]
         if matches:
-            logger.debug(f"Extracted {len(matches)} peer-ids from fullnode.yaml")
+            logger.debug("Extracted %s peer-ids from fullnode.yaml", len(matches))
             return matches
     logger.warning("⚠️  Could not extract peer-ids from fullnode.yaml, seed-peers will lack peer-id")
     return []
 
 
 def create_gateway_config(source: str, dest: str, gateway: IotaNode, validators: List[IotaNode], genesis_dir: str) -> None:
-    logger.debug(f"Creating gateway(fullnode) config: {dest}")
+    logger.debug("Creating gateway(fullnode) config: %s", dest)
     
     peer_ids = extract_peer_ids(genesis_dir)
     
-    lines = [
-        "---",
-        'db-path: "/app/db"',
-        "network-address: /ip4/0.0.0.0/tcp/8080/http",
-        'metrics-address: "0.0.0.0:9184"',
-        "",
-        'json-rpc-address: "0.0.0.0:9000"',
-        "",
-        "genesis:",
-        '  genesis-file-location: "/custom_config/genesis.blob"',
-        "",
-        "p2p-config:",
-        f'  listen-address: "0.0.0.0:{gateway.p2p_port}"',
-        f"  external-address: /ip4/{gateway.ip_addr}/udp/{gateway.p2p_port}/quic",
-        "  seed-peers:",
-    ]
+    lines = [_GATEWAY_YAML_TEMPLATE.format(ip=gateway.ip_addr, p2p_port=gateway.p2p_port)]
     
     for i, v in enumerate(validators):
         if i < len(peer_ids):
@@ -132,39 +228,66 @@ def create_gateway_config(source: str, dest: str, gateway: IotaNode, validators:
     logger.debug("✅ Gateway(fullnode) config created with UDP peer addresses")
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hardlink de ``src`` em ``dst`` (mesmo filesystem: sem copiar bytes),
+    com fallback para cópia quando o link não é possível.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 def prepare_configs(nodes: List[IotaNode], genesis_dir: str, live_data_dir: str) -> None:
     logger.info("Preparing YAML configurations")
     
-    yaml_files = sorted(glob.glob(os.path.join(genesis_dir, "**", "*.y*ml"), recursive=True))
-    logger.debug(f"Found YAMLs: {[os.path.basename(f) for f in yaml_files]}")
+    # DirEntry já traz nome e caminho prontos: sem basename/join por arquivo
+    yaml_entries = sorted(_scan_yaml_files(genesis_dir), key=lambda e: e.path)
+    logger.debug("Found YAMLs: %s", [e.name for e in yaml_entries])
     
     validator_yamls = []
-    for f in yaml_files:
-        base = os.path.basename(f).lower()
-        if any(skip in base for skip in ["client", "iota_config", "fullnode", "network"]):
+    fullnode_yaml = None
+    for entry in yaml_entries:
+        base = entry.name.lower()
+        if fullnode_yaml is None and "fullnode" in base:
+            fullnode_yaml = entry.path
+        if _NON_VALIDATOR_YAML_RE.search(base):
             continue
-        validator_yamls.append(f)
+        validator_yamls.append(entry.path)
         
     validators = [n for n in nodes if n.role == "validator"]
     if not validator_yamls:
         raise RuntimeError(f"No validator templates found in {genesis_dir}. Check genesis generation.")
-        
+    # Os peer-ids do fullnode.yaml seguem a ordem dos validadores no genesis;
+    # com contagens diferentes o pareamento por índice não é confiável
+    peer_ids = extract_peer_ids(genesis_dir)
+    if peer_ids and len(peer_ids) != len(validators):
+        logger.warning(
+            f"⚠️  {len(peer_ids)} peer-ids in fullnode.yaml for {len(validators)} validators: "
+            "seed-peers are paired by index and may not match"
+        )
+
     for i, node in enumerate(validators):
         template = validator_yamls[i % len(validator_yamls)]
-        logger.debug(f"Using template {os.path.basename(template)} for {node.name}")
+        logger.debug("Using template %s for %s", os.path.basename(template), node.name)
         
         node_dir = f"{live_data_dir}/{node.name}"
         os.makedirs(node_dir, exist_ok=True)
-        shutil.copy(f"{genesis_dir}/genesis.blob", f"{node_dir}/genesis.blob")
-        patch_validator_yaml(template, f"{node_dir}/validator.yaml", node, validators)
+        _link_or_copy(f"{genesis_dir}/genesis.blob", f"{node_dir}/genesis.blob")
+        patch_validator_yaml(template, f"{node_dir}/validator.yaml", node, validators, peer_ids)
         
     fullnodes = [n for n in nodes if n.role == "fullnode"]
     if fullnodes:
-        fullnode_yaml = next((f for f in yaml_files if "fullnode" in os.path.basename(f).lower()), validator_yamls[0])
+        fullnode_yaml = fullnode_yaml or validator_yamls[0]
         gateway = fullnodes[0]
         gw_dir = f"{live_data_dir}/{gateway.name}"
         os.makedirs(gw_dir, exist_ok=True)
-        shutil.copy(f"{genesis_dir}/genesis.blob", f"{gw_dir}/genesis.blob")
+        _link_or_copy(f"{genesis_dir}/genesis.blob", f"{gw_dir}/genesis.blob")
         create_gateway_config(fullnode_yaml, f"{gw_dir}/validator.yaml", gateway, validators, genesis_dir)
         
     logger.info("✅ All configurations prepared")
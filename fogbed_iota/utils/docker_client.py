@@ -0,0 +1,33 @@
+import threading
+from typing import Optional
+
+import docker
+from docker.errors import DockerException
+
+from fogbed_iota.utils import get_logger
+
+logger = get_logger('docker_client')
+
+_client: Optional[docker.DockerClient] = None
+_client_unavailable = False
+_client_lock = threading.Lock()
+
+
+def get_docker_client() -> Optional[docker.DockerClient]:
+    """
+    Cliente Docker SDK compartilhado pelo processo: uma conexão HTTP
+    persistente no socket do daemon, em vez de um fork do ``docker`` CLI
+    por chamada. Retorna ``None`` se o daemon não estiver acessível, para
+    que os chamadores caiam no CLI.
+    """
+    global _client, _client_unavailable
+    if _client is not None or _client_unavailable:
+        return _client
+    with _client_lock:
+        if _client is None and not _client_unavailable:
+            try:
+                _client = docker.from_env()
+            except DockerException as e:
+                logger.debug("Docker SDK unavailable, falling back to CLI: %s", e)
+                _client_unavailable = True
+    return _client
@@ -1,15 +1,23 @@
 import os
 import shutil
 import subprocess
+import tarfile
+import tempfile
 import time
 import re
+from collections import deque
 from typing import List
 
+from docker.errors import DockerException
+
 from fogbed_iota.utils import get_logger
+from fogbed_iota.utils.docker_client import get_docker_client
 from fogbed_iota.models.iota_node import IotaNode
 
 logger = get_logger('genesis')
 MIN_IOTA_VERSION = "1.15.0"
+VERSION_PROBE_TIMEOUT = 10
+GENESIS_OUTPUT_TAIL_LINES = 200
 
 
 def compare_versions(v1: str, v2: str) -> int:
@@ -26,7 +34,12 @@ def compare_versions(v1: str, v2: str) -> int:
 
 
 def validate_binary_version(binary_path: str) -> str:
-    result = subprocess.run([binary_path, "--version"], capture_output=True, text=True)
+    try:
+        result = subprocess.run(
+            [binary_path, "--version"], capture_output=True, text=True, timeout=VERSION_PROBE_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"Binary test timed out after {VERSION_PROBE_TIMEOUT}s: {binary_path}")
     if result.returncode != 0:
         raise RuntimeError(f"Binary test failed: {result.stderr}")
     version_match = re.search(r"v?(\d+\.\d+\.\d+)", result.stdout)
@@ -41,6 +54,58 @@ def validate_binary_version(binary_path: str) -> str:
         return "unknown"
 
 
+IOTA_BINARY_IN_IMAGE = "/usr/local/bin/iota"
+
+
+def _extract_binary_sdk(image: str, dest: str) -> bool:
+    """
+    Copia o binário da imagem via Docker SDK (create + get_archive no mesmo
+    socket). Retorna False quando o SDK não está disponível.
+    """
+    client = get_docker_client()
+    if client is None:
+        return False
+    container = client.containers.create(image)
+    try:
+        stream, _ = container.get_archive(IOTA_BINARY_IN_IMAGE)
+        with tempfile.TemporaryFile() as buf:
+            for chunk in stream:
+                buf.write(chunk)
+            buf.seek(0)
+            with tarfile.open(fileobj=buf) as tar:
+                member = tar.extractfile(tar.getmembers()[0])
+                if member is None:
+                    raise RuntimeError(f"{IOTA_BINARY_IN_IMAGE} in {image} is not a regular file")
+                with open(dest, "wb") as out:
+                    shutil.copyfileobj(member, out)
+    finally:
+        try:
+            container.remove(force=True)
+        except DockerException:
+            logger.debug("Failed to remove temporary container: %s", container.id)
+    return True
+
+
+def _extract_binary_cli(image: str, dest: str) -> None:
+    result = subprocess.run(["docker", "create", image], capture_output=True, text=True, check=True)
+    container_id = result.stdout.strip()
+
+    # Só o stderr do `docker cp` é útil (diagnóstico); o resto vai direto para /dev/null
+    try:
+        subprocess.run(
+            ["docker", "cp", f"{container_id}:{IOTA_BINARY_IN_IMAGE}", dest],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+    finally:
+        try:
+            subprocess.run(
+                ["docker", "rm", "-f", container_id],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            logger.debug("Failed to remove temporary container: %s", container_id)
+
+
 def ensure_iota_binary(image: str, current_path: str = None) -> str:
     if current_path:
         return current_path
@@ -57,18 +122,10 @@ def ensure_iota_binary(image: str, current_path: str = None) -> str:
     temp_bin_dir = "/tmp/fogbed_iota_bin"
     os.makedirs(temp_bin_dir, exist_ok=True)
     
-    result = subprocess.run(["docker", "create", image], capture_output=True, text=True, check=True)
-    container_id = result.stdout.strip()
     iota_temp_path = f"{temp_bin_dir}/iota"
-    
-    try:
-        subprocess.run(["docker", "cp", f"{container_id}:/usr/local/bin/iota", iota_temp_path], check=True, capture_output=True)
-    finally:
-        try:
-            subprocess.run(["docker", "rm", "-f", container_id], check=True, capture_output=True)
-        except Exception:
-            logger.debug(f"Failed to remove temporary container: {container_id}")
-            
+    if not _extract_binary_sdk(image, iota_temp_path):
+        _extract_binary_cli(image, iota_temp_path)
+
     os.chmod(iota_temp_path, 0o755)
     validate_binary_version(iota_temp_path)
     return iota_temp_path
@@ -93,8 +150,21 @@ def generate_genesis(validators: List[IotaNode], genesis_dir: str, iota_binary:
         "--epoch-duration-ms", "86400000",
     ]
     
-    logger.debug(f"Genesis command: {' '.join(cmd)}")
-    subprocess.run(cmd, capture_output=True, text=True, check=True)
+    logger.debug("Genesis command: %s", " ".join(cmd))
+    # Consome a saída enquanto o processo roda (sem encher o pipe) e guarda
+    # apenas as últimas linhas para diagnóstico
+    tail = deque(maxlen=GENESIS_OUTPUT_TAIL_LINES)
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace"
+    ) as proc:
+        for line in proc.stdout:
+            tail.append(line)
+        returncode = proc.wait()
+    if returncode != 0:
+        output = "".join(tail)
+        logger.error(f"❌ Genesis generation failed (rc={returncode}):\n{output}")
+        # Mesmo tipo do antigo subprocess.run(check=True); output traz só o final do log
+        raise subprocess.CalledProcessError(returncode, cmd, output=output)
 
     genesis_blob = os.path.join(genesis_dir, "genesis.blob")
     network_yaml = os.path.join(genesis_dir, "network.yaml")
@@ -104,9 +174,11 @@ def generate_genesis(validators: List[IotaNode], genesis_dir: str, iota_binary:
     if not os.path.exists(network_yaml):
         raise RuntimeError(f"network.yaml not created at {network_yaml}")
 
+    # Lê linha a linha: network.yaml cresce com o comitê e só precisamos do
+    # primeiro endereço localhost para abortar
     with open(network_yaml, "r", encoding="utf-8") as f:
-        network_content = f.read()
-    if "/ip4/127.0.0.1/" in network_content:
+        has_localhost = any("/ip4/127.0.0.1/" in line for line in f)
+    if has_localhost:
         raise RuntimeError(
             "Generated network.yaml still contains localhost committee addresses; "
             "consensus will stall. Check genesis --benchmark-ips support."
@@ -1,87 +1,190 @@
+import io
+import logging
 import os
+import shlex
+import subprocess
+import tarfile
 import time
 import json
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+from docker.errors import DockerException
 
 from fogbed_iota.utils import get_logger
+from fogbed_iota.utils.docker_client import get_docker_client
 from fogbed_iota.models.iota_node import IotaNode
 
 logger = get_logger('lifecycle')
 
+RPC_POLL_BASE_DELAY = 0.05
+RPC_POLL_MAX_DELAY = 1.0
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parallel_map(fn: Callable[[T], R], items: Iterable[T], max_workers: int = 16) -> List[R]:
+    """
+    Aplica ``fn`` a cada item em threads (o trabalho é espera por I/O do
+    daemon/containers, o GIL não limita) e retorna os resultados na ordem
+    de entrada. A primeira exceção de qualquer worker é propagada.
+
+    Cada item deve usar um container diferente: o shell de ``node.cmd``
+    não suporta chamadas concorrentes no mesmo nó.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
+
 
 def debug_runtime_ip(node: IotaNode) -> None:
-    out = node.cmd("sh -lc \"ip -4 addr show | grep -oE '10\\.0\\.0\\.[0-9]+' | head -n1 || true\"").strip()
-    logger.debug(f"Node {node.name} (role={node.role}, expected_ip={node.ip_addr}, runtime_ip={out})")
+    # IP em runtime + listagem da config num único round-trip ao container
+    out = node.cmd(
+        "sh -c \"ip -4 addr show | grep -oE '10\\.0\\.0\\.[0-9]+' | head -n1; "
+        "ls -la /custom_config\" 2>&1 || true"
+    ).strip()
+    runtime_ip, _, listing = out.partition("\n")
+    logger.debug("Node %s (role=%s, expected_ip=%s, runtime_ip=%s)", node.name, node.role, node.ip_addr, runtime_ip.strip())
+    logger.debug("/custom_config on %s:\n%s", node.name, listing)
 
 
 def wait_node_process(node: IotaNode, timeout: int = 30) -> None:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        out = node.cmd("sh -lc 'test -f /var/log/iota/iota-node.pid && ps -p $(cat /var/log/iota/iota-node.pid) >/dev/null 2>&1 && echo OK || echo NOK'")
-        if "OK" in out:
-            logger.debug(f"✅ Process started on {node.name}")
-            return
-        time.sleep(1)
-    tail = node.cmd("sh -lc 'tail -n 200 /var/log/iota/iota-node.log 2>/dev/null || true'")
+    # Mesmo esquema de wait_port_open: loop no container, um único node.cmd
+    pid_file = "/var/log/iota/iota-node.pid"
+    script = (
+        f"end=$(( $(date +%s) + {int(timeout)} )); "
+        "while [ $(date +%s) -lt $end ]; do "
+        f"[ -f {pid_file} ] && ps -p $(cat {pid_file}) >/dev/null 2>&1 "
+        "&& { echo READY; exit 0; }; "
+        "sleep 0.5; "
+        "done; echo TIMEOUT"
+    )
+    out = node.cmd(f"sh -c {shlex.quote(script)}")
+    if "READY" in out:
+        logger.debug("✅ Process started on %s", node.name)
+        return
+    tail = node.cmd("tail -n 200 /var/log/iota/iota-node.log 2>/dev/null || true")
     raise RuntimeError(f"iota-node failed to start on {node.name}. Last log:\n{tail}")
 
 
 def wait_port_open(node: IotaNode, port: int, timeout: int = 90) -> None:
-    deadline = time.time() + timeout
-    check_tool = node.cmd("command -v ss >/dev/null 2>&1 && echo ss || echo netstat").strip()
-    if check_tool == "ss":
-        check_cmd = f"ss -lnt | grep -q ':{port}'"
-    else:
-        check_cmd = f"netstat -lnt | grep -q ':{port}'"
-    logger.debug(f"Waiting for port {port} on {node.name} using {check_tool}")
-    while time.time() < deadline:
-        out = node.cmd(f"sh -lc '{check_cmd} && echo OK || echo NOK'")
-        if "OK" in out:
-            logger.debug(f"✅ Port {port} open on {node.name}")
-            return
-        time.sleep(2)
-    tail = node.cmd("sh -lc 'tail -n 220 /var/log/iota/iota-node.log 2>/dev/null || true'")
+    # Um único node.cmd: o polling roda num loop dentro do container, não em
+    # um round-trip pelo shell do Mininet a cada tentativa
+    script = (
+        f"end=$(( $(date +%s) + {int(timeout)} )); "
+        "while [ $(date +%s) -lt $end ]; do "
+        f"(ss -lnt 2>/dev/null || netstat -lnt 2>/dev/null) | grep -q ':{port} ' "
+        "&& { echo READY; exit 0; }; "
+        "sleep 0.5; "
+        "done; echo TIMEOUT"
+    )
+    logger.debug("Waiting for port %s on %s", port, node.name)
+    out = node.cmd(f"sh -c {shlex.quote(script)}")
+    if "READY" in out:
+        logger.debug("✅ Port %s open on %s", port, node.name)
+        return
+    tail = node.cmd("tail -n 220 /var/log/iota/iota-node.log 2>/dev/null || true")
     raise RuntimeError(f"Port {port} did not open on {node.name} within {timeout}s. Last log:\n{tail}")
 
 
-def inject_and_start_node(node: IotaNode, live_data_dir: str) -> None:
+def push_directory(container_name: str, src_dir: str, dest_dir: str) -> None:
+    """
+    Envia ``src_dir`` para ``dest_dir`` (caminho absoluto) no container
+    ``mn.<container_name>`` como um único stream tar.
+    O diretório de destino é criado pela própria extração. Usa o Docker SDK
+    (``put_archive``) quando disponível e o CLI como fallback.
+    """
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        tar.add(src_dir, arcname=dest_dir.strip("/"))
+    client = get_docker_client()
+    if client is not None:
+        try:
+            if not client.containers.get(f"mn.{container_name}").put_archive("/", buf.getvalue()):
+                raise RuntimeError(f"put_archive rejected by daemon for {container_name}")
+        except DockerException as e:
+            raise RuntimeError(f"docker put_archive failed for {container_name}: {e}") from e
+        return
+    result = subprocess.run(
+        ["docker", "cp", "-", f"mn.{container_name}:/"],
+        input=buf.getvalue(), capture_output=True,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"docker cp failed for {container_name} (exit code {result.returncode}): {stderr}")
+
+
+def inject_node_config(node: IotaNode, live_data_dir: str) -> None:
     src_dir = f"{live_data_dir}/{node.name}"
     if not os.path.exists(src_dir):
         raise RuntimeError(f"Config directory missing for {node.name}: {src_dir}")
+    push_directory(node.name, src_dir, "/custom_config")
+    logger.debug("Successfully copied %s to mn.%s:/custom_config/", src_dir, node.name)
+
+
+def inject_configs(nodes: List[IotaNode], live_data_dir: str) -> None:
+    """
+    Copia as configs de todos os nós em paralelo; cada thread dispara um
+    `docker cp` independente, sem usar o shell dos containers.
+    """
+    if not nodes:
+        return
+    logger.info(f"Injecting configs into {len(nodes)} nodes in parallel...")
+    parallel_map(lambda n: inject_node_config(n, live_data_dir), nodes)
+
+
+def start_node(node: IotaNode) -> None:
     logger.info(f"Booting node: {node.name} (role={node.role}, ip={node.ip_addr})")
-    node.cmd("mkdir -p /custom_config")
-    cmd = f"docker cp {src_dir}/. mn.{node.name}:/custom_config/"
-    rc = os.system(cmd)
-    if rc != 0:
-        raise RuntimeError(f"docker cp failed for {node.name} (exit code {rc})")
-    logger.debug(f"Successfully copied {src_dir} to mn.{node.name}:/custom_config/")
-    node.cmd("sh -lc 'ls -la /custom_config && echo --- && head -n 80 /custom_config/validator.yaml'")
-    debug_runtime_ip(node)
-    time.sleep(1)
-    node.cmd(node.get_config_command())
+    if logger.isEnabledFor(logging.DEBUG):
+        debug_runtime_ip(node)
+    # sh -c isola o `set -e` do comando de boot do shell persistente do container
+    node.cmd(f"sh -c {shlex.quote(node.get_config_command())}")
     wait_node_process(node, timeout=30)
 
 
+def inject_and_start_node(node: IotaNode, live_data_dir: str) -> None:
+    inject_node_config(node, live_data_dir)
+    start_node(node)
+
+
+def _start_fullnode(node: IotaNode) -> None:
+    start_node(node)
+    wait_port_open(node, 9000, timeout=90)
+
+
+def _wait_validator_up(node: IotaNode, timeout: int = 60) -> None:
+    # Substitui o settle fixo: validador lento só gera aviso, sem abortar o start
+    try:
+        wait_port_open(node, node.metrics_port, timeout=timeout)
+    except RuntimeError as e:
+        logger.warning(f"⚠️ Metrics port {node.metrics_port} not open on {node.name} after {timeout}s, proceeding anyway...")
+        logger.debug("%s", e)
+
+
 def inject_and_boot(nodes: List[IotaNode], live_data_dir: str) -> None:
     logger.info("Injecting configs and booting nodes")
     validators = [n for n in nodes if n.role == "validator"]
     fullnodes = [n for n in nodes if n.role == "fullnode"]
     
+    inject_configs(validators + fullnodes, live_data_dir)
+
     logger.info(f"Starting {len(validators)} validators sequentially...")
     for i, node in enumerate(validators):
-        inject_and_start_node(node, live_data_dir)
+        start_node(node)
         if i < len(validators) - 1:
-            logger.debug(f"Waiting 8s before starting next validator...")
+            logger.debug("Waiting 8s before starting next validator...")
             time.sleep(8)
             
     if validators:
-        logger.info("Waiting 15s for validator network to stabilize...")
-        time.sleep(15)
+        # Em vez de dormir 15s fixos: cada validador precisa estar servindo métricas
+        logger.info("Waiting for validators to come up...")
+        parallel_map(_wait_validator_up, validators)
         
     logger.info(f"Starting {len(fullnodes)} fullnodes...")
-    for node in fullnodes:
-        inject_and_start_node(node, live_data_dir)
-        wait_port_open(node, 9000, timeout=90)
+    parallel_map(_start_fullnode, fullnodes)
         
     logger.info("✅ All nodes booted successfully")
 
@@ -95,19 +198,24 @@ def wait_for_network_ready(nodes: List[IotaNode], timeout: int = 90) -> None:
         
     deadline = time.time() + timeout
     rpc_url = f"http://{gateway.ip_addr}:{gateway.rpc_port}"
+    attempts = 0
     while time.time() < deadline:
         try:
-            result = gateway.cmd(f'curl -s -X POST {rpc_url} -H "Content-Type: application/json" -d \'{{' + '"jsonrpc":"2.0","method":"iota_getTotalTransactionBlocks","params":[],"id":1}}\' 2>/dev/null || echo FAIL')
-            if "FAIL" not in result and "error" not in result.lower():
-                try:
-                    data = json.loads(result)
-                    if "result" in data:
-                        logger.info(f"✅ RPC responding: {data}")
-                        return
-                except json.JSONDecodeError:
-                    pass
+            result = gateway.cmd(f'curl -s --max-time 1 -X POST {rpc_url} -H "Content-Type: application/json" -d \'{{' + '"jsonrpc":"2.0","method":"iota_getTotalTransactionBlocks","params":[],"id":1}}\' 2>/dev/null || echo FAIL')
+            # Parse exato da resposta: "FAIL" e respostas de erro JSON-RPC não
+            # têm "result", sem precisar de um .lower() da saída a cada tentativa
+            try:
+                data = json.loads(result)
+            except json.JSONDecodeError:
+                data = None
+            if isinstance(data, dict) and "result" in data:
+                logger.info(f"✅ RPC responding: {data}")
+                return
         except Exception as e:
-            logger.debug(f"RPC check failed: {e}")
-        time.sleep(3)
+            logger.debug("RPC check failed: %s", e)
+        # Backoff exponencial de 50ms até 1s: RPC que sobe rápido é detectado
+        # logo, e a espera longa não martela o gateway
+        time.sleep(min(RPC_POLL_MAX_DELAY, RPC_POLL_BASE_DELAY * (1.5 ** attempts)))
+        attempts += 1
         
     logger.warning(f"⚠️ RPC did not respond within {timeout}s, proceeding anyway...")
@@ -53,9 +53,9 @@ def extract_json_from_output(output: str) -> Dict[str, Any]:
     )
 
 
-def tx_digest(tx: Dict[str, Any]) -> str:
+def tx_digest(tx: Dict[str, Any], default: str = "unknown") -> str:
     effects = tx.get("effects") or {}
-    return tx.get("digest") or effects.get("transactionDigest") or "unknown"
+    return tx.get("digest") or effects.get("transactionDigest") or default
 
 
 def tx_error(tx: Dict[str, Any]) -> Optional[str]:
@@ -3,12 +3,36 @@
 Validação de inputs para fogbed-iota
 """
 
+import os
 import re
+import stat
+from functools import lru_cache
 from ipaddress import ip_address, AddressValueError
+from typing import Optional
 from fogbed_iota.utils.logging import get_logger
 
 logger = get_logger('validation')
 
+# Docker: lowercase, numbers, dash, underscore, max 63 chars
+_CONTAINER_NAME_RE = re.compile(r'^[a-z0-9_-]{1,63}$')
+
+
+# Checagens puras em cache: topologias grandes repetem os mesmos valores.
+# O log fica nos wrappers públicos, para sair a cada valor inválido visto
+@lru_cache(maxsize=4096)
+def _ip_error(ip_str) -> Optional[str]:
+    """Mensagem de erro de ``ip_address`` ou ``None`` se o IP é válido"""
+    try:
+        ip_address(ip_str)
+        return None
+    except (AddressValueError, ValueError) as e:
+        return str(e)
+
+
+@lru_cache(maxsize=4096)
+def _is_container_name(name) -> bool:
+    return _CONTAINER_NAME_RE.match(name) is not None
+
 
 def validate_ip(ip_str):
     """
@@ -20,13 +44,14 @@ def validate_ip(ip_str):
     Returns:
         bool: IP válido
     """
-    try:
-        ip_address(ip_str)
-        logger.debug(f"✅ Valid IP: {ip_str}")
+    # Entradas não-hasháveis não passam pelo cache
+    check = _ip_error if isinstance(ip_str, (str, int)) else _ip_error.__wrapped__
+    error = check(ip_str)
+    if error is None:
+        logger.debug("✅ Valid IP: %s", ip_str)
         return True
-    except (AddressValueError, ValueError) as e:
-        logger.error(f"❌ Invalid IP: {ip_str} - {str(e)}")
-        return False
+    logger.error(f"❌ Invalid IP: {ip_str} - {error}")
+    return False
 
 
 def validate_port(port):
@@ -46,7 +71,7 @@ def validate_port(port):
         if not valid:
             logger.error(f"❌ Port out of range: {port_num}")
         else:
-            logger.debug(f"✅ Valid port: {port_num}")
+            logger.debug("✅ Valid port: %s", port_num)
         
         return valid
     
@@ -65,13 +90,11 @@ def validate_container_name(name):
     Returns:
         bool: Nome válido
     """
-    # Docker: lowercase, numbers, dash, underscore, max 63 chars
-    pattern = r'^[a-z0-9_-]{1,63}$'
-    
-    valid = bool(re.match(pattern, name))
+    check = _is_container_name if isinstance(name, str) else _is_container_name.__wrapped__
+    valid = check(name)
     
     if valid:
-        logger.debug(f"✅ Valid container name: {name}")
+        logger.debug("✅ Valid container name: %s", name)
     else:
         logger.error(f"❌ Invalid container name: {name}")
     
@@ -180,19 +203,18 @@ def validate_genesis_blob(blob_path):
     Returns:
         bool: Arquivo válido
     """
-    from pathlib import Path
-    
-    path = Path(blob_path)
-    
-    if not path.exists():
+    # Um único stat() responde existência, tipo e tamanho
+    try:
+        st = os.stat(blob_path)
+    except OSError:
         logger.error(f"❌ Genesis blob not found: {blob_path}")
         return False
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         logger.error(f"❌ Genesis path is not a file: {blob_path}")
         return False
     
-    size_mb = path.stat().st_size / (1024 * 1024)
+    size_mb = st.st_size / (1024 * 1024)
     
     if size_mb < 0.1:
         logger.error(f"❌ Genesis blob too small: {size_mb:.2f}MB")
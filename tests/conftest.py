@@ -4,14 +4,8 @@
 Configuração global de testes do projeto fogbed_iota
 """
 
-import sys
-from pathlib import Path
 import pytest
 
-# Adiciona raiz do projeto ao PYTHONPATH
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 
 def pytest_configure(config):
     """Configuração executada antes dos testes"""
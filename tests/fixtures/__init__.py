@@ -2,8 +2,8 @@
 
 """
 Fixtures para testes do fogbed_iota
+
+As fixtures do cliente RPC/GraphQL ficam em ``tests/unit/conftest.py``.
 """
 
-from tests.fixtures.client_fixtures import *
 from tests.fixtures.node_fixtures import *
-from tests.fixtures.network_fixtures import *
@@ -2,35 +2,104 @@
 Fixtures para testes unitários do cliente IOTA
 """
 
+import json
 import pytest
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 
+import httpx
+from requests import Response
+from requests.adapters import BaseAdapter
 
-@pytest.fixture
+from fogbed_iota.client import AsyncIotaRpcClient, IotaRpcClient
+
+
+# Respostas constantes: montadas uma vez por sessão e somente leitura,
+# para que um teste não altere o dado visto pelos outros
+_BALANCE = MappingProxyType({
+    "coinType": "0x2::iota::IOTA",
+    "coinObjectCount": 5,
+    "totalBalance": "1000000000",
+    "lockedBalance": {}
+})
+
+_CHECKPOINT = MappingProxyType({
+    "epoch": "100",
+    "sequenceNumber": "5000",
+    "digest": "ABC123CHECKPOINT",
+    "networkTotalTransactions": "10000",
+    "previousDigest": "ABC122CHECKPOINT"
+})
+
+_COINS_PAGE = MappingProxyType({
+    "data": [
+        {
+            "coinType": "0x2::iota::IOTA",
+            "coinObjectId": "0xCOIN001",
+            "balance": "100000000"
+        },
+        {
+            "coinType": "0x2::iota::IOTA",
+            "coinObjectId": "0xCOIN002",
+            "balance": "200000000"
+        }
+    ],
+    "nextCursor": "cursor_abc123",
+    "hasNextPage": True
+})
+
+_OBJECT = MappingProxyType({
+    "data": {
+        "objectId": "0xABC123",
+        "type": "0x2::coin::Coin<0x2::iota::IOTA>",
+        "balance": "1000000",
+        "version": "1",
+        "digest": "OBJ_DIGEST"
+    },
+    "status": "exists"
+})
+
+_OWNED_OBJECTS = MappingProxyType({
+    "data": [
+        {"objectId": "0xCOIN1", "type": "0x2::iota::IOTA"},
+        {"objectId": "0xCOIN2", "type": "0x2::iota::IOTA"}
+    ],
+    "hasNextPage": False,
+    "nextCursor": None
+})
+
+
+@pytest.fixture(scope="session")
 def mock_rpc_endpoint():
     """Endpoint RPC de teste"""
     return "http://localhost:9000"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_graphql_endpoint():
     """Endpoint GraphQL de teste"""
     return "https://graphql.testnet.iota.cafe"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_address():
     """Endereço IOTA de teste"""
     return "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_tx_digest():
     """Digest de transação de teste"""
     return "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz0123456789AB"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def test_object_id():
+    """Object ID de teste"""
+    return "0xabcd1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+
+
+@pytest.fixture(scope="session")
 def mock_rpc_response():
     """Factory para criar resposta RPC mockada"""
     def _mock_response(result: Any) -> Dict[str, Any]:
@@ -42,7 +111,7 @@ def mock_rpc_response():
     return _mock_response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rpc_error():
     """Factory para criar erro RPC mockado"""
     def _mock_error(code: int, message: str, data: Any = None) -> Dict[str, Any]:
@@ -58,21 +127,16 @@ def mock_rpc_error():
     return _mock_error
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_balance_response():
     """Resposta de balance mockada"""
-    return {
-        "coinType": "0x2::iota::IOTA",
-        "coinObjectCount": 5,
-        "totalBalance": "1000000000",
-        "lockedBalance": {}
-    }
+    return _BALANCE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_transaction_response(test_tx_digest, test_address):
     """Resposta de transação mockada"""
-    return {
+    return MappingProxyType({
         "digest": test_tx_digest,
         "transaction": {
             "data": {
@@ -89,69 +153,152 @@ def mock_transaction_response(test_tx_digest, test_address):
             }
         },
         "events": []
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_checkpoint_response():
     """Resposta de checkpoint mockada"""
-    return {
-        "epoch": "100",
-        "sequenceNumber": "5000",
-        "digest": "ABC123CHECKPOINT",
-        "networkTotalTransactions": "10000",
-        "previousDigest": "ABC122CHECKPOINT"
-    }
+    return _CHECKPOINT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_coins_page():
     """Página de coins mockada com paginação"""
-    return {
-        "data": [
-            {
-                "coinType": "0x2::iota::IOTA",
-                "coinObjectId": "0xCOIN001",
-                "balance": "100000000"
-            },
-            {
-                "coinType": "0x2::iota::IOTA",
-                "coinObjectId": "0xCOIN002",
-                "balance": "200000000"
-            }
-        ],
-        "nextCursor": "cursor_abc123",
-        "hasNextPage": True
-    }
+    return _COINS_PAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_graphql_response():
     """Factory para criar resposta GraphQL mockada"""
     def _mock_graphql(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"data": data}
     return _mock_graphql
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def mock_graphql_error():
+    """Factory para criar erro GraphQL mockado"""
+    def _mock_error(message: str, locations: list = None) -> Dict[str, Any]:
+        error = {"message": message}
+        if locations:
+            error["locations"] = locations
+        return {"errors": [error]}
+    return _mock_error
+
+@pytest.fixture(scope="session")
 def mock_object_response():
-    return {
-        "data": {
-            "objectId": "0xABC123",
-            "type": "0x2::coin::Coin<0x2::iota::IOTA>",
-            "balance": "1000000",
-            "version": "1",
-            "digest": "OBJ_DIGEST"
-        },
-        "status": "exists"
-    }
+    return _OBJECT
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_owned_objects_response():
-    return {
-        "data": [
-            {"objectId": "0xCOIN1", "type": "0x2::iota::IOTA"},
-            {"objectId": "0xCOIN2", "type": "0x2::iota::IOTA"}
-        ],
-        "hasNextPage": False,
-        "nextCursor": None
-    }
\ No newline at end of file
+    return _OWNED_OBJECTS
+
+
+# ==================== Transporte RPC em processo ====================
+
+class RpcStubAdapter(BaseAdapter):
+    """
+    Adapter ``requests`` (e handler de ``httpx.MockTransport``) que responde
+    JSON-RPC em processo, pelo nome do método, no lugar de ``mock.patch`` por teste. Batches são respondidos
+    item a item; com vários resultados para um método, cada chamada consome
+    um e o último se repete.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self) -> None:
+        self._results: Dict[str, List[Any]] = {}
+        self._errors: Dict[str, Dict[str, Any]] = {}
+        self._raw: Optional[Tuple[bytes, int]] = None
+        self._exception: Optional[Exception] = None
+        self.payloads: List[Any] = []
+
+    def set_response(self, method: str, *results: Any) -> None:
+        self._results[method] = list(results)
+
+    def set_error(self, method: str, code: int, message: str, data: Any = None) -> None:
+        self._errors[method] = {"code": code, "message": message, "data": data}
+
+    def set_raw(self, body: Any, status: int = 200) -> None:
+        """Corpo HTTP fixo (ex.: batch fora de ordem ou resposta não-200)"""
+        if not isinstance(body, bytes):
+            body = json.dumps(body, default=dict).encode()
+        self._raw = (body, status)
+
+    def set_exception(self, exc: Exception) -> None:
+        self._exception = exc
+
+    @property
+    def call_count(self) -> int:
+        return len(self.payloads)
+
+    @property
+    def last_payload(self) -> Any:
+        return self.payloads[-1]
+
+    def _reply(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        method = call["method"]
+        if method in self._errors:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": self._errors[method]}
+        results = self._results[method]
+        result = results.pop(0) if len(results) > 1 else results[0]
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def respond(self, body: bytes) -> Tuple[bytes, int]:
+        """Corpo e status HTTP da resposta ao corpo JSON-RPC ``body``"""
+        payload = json.loads(body)
+        self.payloads.append(payload)
+        if self._exception is not None:
+            raise self._exception
+        if self._raw is not None:
+            return self._raw
+        if isinstance(payload, list):
+            reply = [self._reply(call) for call in payload]
+        else:
+            reply = self._reply(payload)
+        return json.dumps(reply, default=dict).encode(), 200
+
+    def send(self, request, **kwargs) -> Response:
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response._content, response.status_code = self.respond(request.body)
+        return response
+
+    def handle_httpx(self, request: httpx.Request) -> httpx.Response:
+        """Handler para ``httpx.MockTransport`` (cliente assíncrono)"""
+        content, status = self.respond(request.content)
+        return httpx.Response(status, content=content, request=request)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def _rpc_stub_adapter():
+    return RpcStubAdapter()
+
+
+@pytest.fixture
+def rpc_stub(_rpc_stub_adapter):
+    """Transporte stub da sessão, com as respostas zeradas para o teste"""
+    _rpc_stub_adapter.reset()
+    return _rpc_stub_adapter
+
+
+@pytest.fixture
+def rpc_client(rpc_stub, mock_rpc_endpoint):
+    """IotaRpcClient novo por teste, com a sessão HTTP falando com ``rpc_stub``"""
+    client = IotaRpcClient(mock_rpc_endpoint)
+    client._session.mount("http://", rpc_stub)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def async_rpc_client(rpc_stub, mock_rpc_endpoint):
+    """AsyncIotaRpcClient cujo transport httpx fala com ``rpc_stub``"""
+    return AsyncIotaRpcClient(mock_rpc_endpoint, transport=httpx.MockTransport(rpc_stub.handle_httpx))
@@ -10,7 +10,7 @@ def mock_cli_or_container():
     cli = MagicMock()
     # Mocking IotaCLI behavior
     cli.new_address.return_value = ["0x123", "word1 word2"]
-    cli.get_gas.return_value = [{"balance": "1000", "coinObjectId": "0xc1"}]
+    cli.get_balance.return_value = 1000
     return cli
 
 def test_account_manager_create_account(mock_cli_or_container):
@@ -31,10 +31,18 @@ def test_account_manager_get_balance(mock_cli_or_container):
         mock_gen.return_value = IotaAccount(address="0x123", alias="alice")
         manager.generate_account("alice")
     
-    # Need to patch IotaCLI.get_gas
+    # Need to patch IotaCLI.get_balance
     manager.cli = MagicMock()
-    manager.cli.get_gas.return_value = [{"balance": 1000, "coinObjectId": "0xc1"}]
+    manager.cli.get_balance.return_value = 1000
     
     balance = manager.get_balance("alice")
     assert balance == 1000
-    manager.cli.get_gas.assert_called_with("0x123")
+    manager.cli.get_balance.assert_called_with("0x123")
+
+def test_account_manager_reuses_given_cli(mock_cli_or_container):
+    container = MagicMock()
+    with patch('fogbed_iota.accounts.manager.IotaCLI') as mock_cli_cls:
+        manager = AccountManager(container, cli=mock_cli_or_container)
+
+    mock_cli_cls.assert_not_called()
+    assert manager.cli is mock_cli_or_container
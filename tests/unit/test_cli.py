@@ -0,0 +1,116 @@
+# tests/unit/test_cli.py
+
+"""
+Testes unitários do wrapper do CLI ``iota`` (client/cli.py), com o
+``cmd()`` do container mockado
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from fogbed_iota.client.cli import IotaCLI
+
+pytestmark = pytest.mark.unit
+
+
+ADDRESS = "0x" + "ab" * 32
+COIN_1 = "0x" + "11" * 32
+COIN_2 = "0x" + "22" * 32
+
+# `iota client balance --json`: [[metadata, [coins]], ...], hasNextPage
+BALANCE_JSON = json.dumps([
+    [
+        [
+            {"decimals": 9, "symbol": "IOTA"},
+            [
+                {"coinType": "0x2::iota::IOTA", "coinObjectId": COIN_1, "version": "3", "balance": "1500000000"},
+                {"coinType": "0x2::iota::IOTA", "coinObjectId": COIN_2, "version": "4", "balance": "500000000"},
+            ],
+        ],
+        [
+            {"decimals": 6, "symbol": "USDT"},
+            [{"coinType": "0xbeef::usdt::USDT", "coinObjectId": "0x33", "balance": "777"}],
+        ],
+    ],
+    False,
+])
+
+GAS_TABLE = f"""\
+╭────────────────────────────────────────────────────────────────────┬────────────────────┬──────────────────╮
+│ gasCoinId                                                          │ nanosBalance (NANOS) │ iotaBalance (IOTA) │
+├────────────────────────────────────────────────────────────────────┼────────────────────┼──────────────────┤
+│ {COIN_1} │ 1500000000         │ 1.50             │
+│ {COIN_2} │ 500000000          │ 0.50             │
+╰────────────────────────────────────────────────────────────────────┴────────────────────┴──────────────────╯
+"""
+
+
+def make_cli(outputs):
+    """
+    IotaCLI sobre um container mockado: ``outputs`` mapeia um trecho do
+    comando para a saída; o primeiro trecho contido no comando vence
+    """
+    container = MagicMock()
+
+    def cmd(command):
+        if command == "which iota":
+            return "/usr/local/bin/iota"
+        for fragment, out in outputs.items():
+            if fragment in command:
+                return out
+        return ""
+
+    container.cmd.side_effect = cmd
+    return IotaCLI(container)
+
+
+def test_get_balance_sums_iota_coins_from_json():
+    """Testa a soma dos coins IOTA no JSON do `balance` (outros coinTypes ignorados)"""
+    cli = make_cli({f"balance {ADDRESS} --json": BALANCE_JSON})
+
+    assert cli.get_balance(ADDRESS) == 2_000_000_000
+    assert cli.get_balance(ADDRESS, coin_type="::usdt::USDT") == 777
+
+
+def test_get_balance_falls_back_to_gas_table():
+    """Testa o fallback para a soma da tabela de gas quando o CLI não devolve JSON"""
+    cli = make_cli({
+        "balance": "error: unexpected argument '--json' found",
+        "--json": "error: unexpected argument '--json' found",
+        f"gas {ADDRESS}": GAS_TABLE,
+    })
+
+    assert cli.get_balance(ADDRESS) == 2_000_000_000
+
+
+def test_get_gas_maps_json_keys():
+    """Testa o mapeamento das chaves de `gas --json` (nomes antigos e novos)"""
+    cli = make_cli({f"gas {ADDRESS} --json": json.dumps([
+        {"gasCoinId": COIN_1, "nanosBalance": 1500000000, "iotaBalance": "1.50"},
+        {"gasCoinId": COIN_2, "mistBalance": "500000000"},
+        {"coinObjectId": "0x44", "balance": 7},
+        {"gasCoinId": "0x55"},
+    ])})
+
+    assert cli.get_gas(ADDRESS) == [
+        {"object_id": COIN_1, "balance": 1500000000},
+        {"object_id": COIN_2, "balance": 500000000},
+        {"object_id": "0x44", "balance": 7},
+    ]
+
+
+def test_get_gas_falls_back_to_table():
+    """Testa o parse da tabela em texto quando `--json` não é suportado"""
+    cli = make_cli({
+        "--json": "error: unexpected argument '--json' found",
+        f"gas {ADDRESS}": GAS_TABLE,
+    })
+
+    assert cli.get_gas(ADDRESS) == [
+        {"object_id": COIN_1, "balance": 1500000000},
+        {"object_id": COIN_2, "balance": 500000000},
+    ]
+    commands = [call.args[0] for call in cli.container.cmd.call_args_list]
+    assert commands[-1].endswith(f"gas {ADDRESS}")
@@ -0,0 +1,159 @@
+# tests/unit/test_config.py
+
+"""
+Testes unitários da geração de configs YAML dos nós (utils/config)
+"""
+
+import pytest
+import yaml
+
+from fogbed_iota.models.iota_node import IotaNode
+from fogbed_iota.utils.config import patch_validator_yaml, prepare_configs
+
+pytestmark = pytest.mark.unit
+
+
+# Template de validador no formato gerado pelo `iota genesis`
+VALIDATOR_TEMPLATE = """\
+protocol-key-pair:
+  path: /root/.iota/authority.key
+db-path: /root/.iota/authorities_db/abc123
+network-address: /ip4/127.0.0.1/tcp/2010/http
+metrics-address: 127.0.0.1:38001
+consensus-config:
+  db-path: /root/.iota/consensus_db/abc123
+  db-retention-epochs: 0
+genesis:
+  genesis-file-location: /root/.iota/genesis.blob
+authority-store-pruning-config:
+  num-epochs-to-retain: 0
+  pruning-period: 60
+  max-checkpoints-in-batch: 10
+p2p-config:
+  listen-address: 127.0.0.1:2011
+  external-address: /ip4/127.0.0.1/udp/2011
+"""
+
+PEER_IDS = ["peerA", "peerB", "peerC"]
+
+
+def _fullnode_yaml(peer_ids):
+    seeds = [
+        {"peer-id": peer_id, "address": f"/ip4/127.0.0.1/udp/{2011 + i * 10}"}
+        for i, peer_id in enumerate(peer_ids)
+    ]
+    return yaml.safe_dump({"db-path": "/root/.iota/full_node_db", "p2p-config": {"seed-peers": seeds}})
+
+
+@pytest.fixture
+def validators():
+    return [IotaNode(f"val{i}", f"10.0.0.{i}", port_offset=i - 1) for i in (1, 2, 3)]
+
+
+@pytest.fixture
+def validator_template(tmp_path):
+    path = tmp_path / "127.0.0.1-2010.yaml"
+    path.write_text(VALIDATOR_TEMPLATE)
+    return str(path)
+
+
+def _patch(template, tmp_path, node, validators, peer_ids=None):
+    dest = tmp_path / f"{node.name}.yaml"
+    patch_validator_yaml(template, str(dest), node, validators, peer_ids)
+    return yaml.safe_load(dest.read_text())
+
+
+def test_patch_validator_yaml_paths_and_addresses(validator_template, tmp_path, validators):
+    """Testa os caminhos e endereços reescritos para rodar dentro do container"""
+    node = validators[1]
+    cfg = _patch(validator_template, tmp_path, node, validators)
+
+    assert cfg["db-path"] == "/app/db"
+    assert cfg["consensus-config"]["db-path"] == "/app/consensus_db"
+    assert cfg["genesis"]["genesis-file-location"] == "/custom_config/genesis.blob"
+    # Porta de rede preservada do template, mas escutando em todas as interfaces
+    assert cfg["network-address"] == "/ip4/0.0.0.0/tcp/2010/http"
+    assert cfg["metrics-address"] == "0.0.0.0:9184"
+    assert cfg["p2p-config"]["listen-address"] == "0.0.0.0:2011"
+    assert cfg["p2p-config"]["external-address"] == "/ip4/10.0.0.2/udp/2011/quic"
+    # Chaves não tocadas continuam lá
+    assert cfg["protocol-key-pair"] == {"path": "/root/.iota/authority.key"}
+
+
+def test_patch_validator_yaml_drops_pruning_keys(validator_template, tmp_path, validators):
+    """Testa remoção das chaves de poda em qualquer nível"""
+    cfg = _patch(validator_template, tmp_path, validators[0], validators)
+
+    assert cfg["authority-store-pruning-config"] == {"max-checkpoints-in-batch": 10}
+    assert cfg["consensus-config"]["db-retention-epochs"] == 0
+
+
+def test_patch_validator_yaml_seed_peers_without_peer_ids(validator_template, tmp_path, validators):
+    """Testa seed-peers apontando para os outros validadores (sem peer-id conhecido)"""
+    cfg = _patch(validator_template, tmp_path, validators[0], validators)
+
+    assert cfg["p2p-config"]["seed-peers"] == [
+        {"address": "/ip4/10.0.0.2/udp/2011/quic"},
+        {"address": "/ip4/10.0.0.3/udp/2021/quic"},
+    ]
+
+
+def test_patch_validator_yaml_rejects_non_mapping(tmp_path, validators):
+    """Testa template que não é um mapping YAML"""
+    template = tmp_path / "broken.yaml"
+    template.write_text("- just\n- a list\n")
+
+    with pytest.raises(RuntimeError, match="not a YAML mapping"):
+        _patch(str(template), tmp_path, validators[0], validators)
+
+
+def test_patch_validator_yaml_pairs_peer_ids_by_index(validator_template, tmp_path, validators):
+    """Testa que o i-ésimo peer-id acompanha o endereço do i-ésimo validador"""
+    cfg = _patch(validator_template, tmp_path, validators[1], validators, PEER_IDS)
+
+    assert cfg["p2p-config"]["seed-peers"] == [
+        {"peer-id": "peerA", "address": "/ip4/10.0.0.1/udp/2001/quic"},
+        {"peer-id": "peerC", "address": "/ip4/10.0.0.3/udp/2021/quic"},
+    ]
+
+
+@pytest.fixture
+def genesis_dir(tmp_path):
+    path = tmp_path / "genesis"
+    path.mkdir()
+    (path / "genesis.blob").write_bytes(b"\0" * 16)
+    (path / "127.0.0.1-2010.yaml").write_text(VALIDATOR_TEMPLATE)
+    return path
+
+
+def test_prepare_configs_pairs_fullnode_peer_ids(genesis_dir, tmp_path, validators):
+    """Testa prepare_configs lendo os peer-ids do fullnode.yaml do genesis"""
+    (genesis_dir / "fullnode.yaml").write_text(_fullnode_yaml(PEER_IDS))
+    gateway = IotaNode("gw", "10.0.0.10", role="fullnode", port_offset=3)
+    live = tmp_path / "live"
+
+    prepare_configs(validators + [gateway], str(genesis_dir), str(live))
+
+    for i, node in enumerate(validators):
+        cfg = yaml.safe_load((live / node.name / "validator.yaml").read_text())
+        seeds = cfg["p2p-config"]["seed-peers"]
+        assert [seed["peer-id"] for seed in seeds] == [p for j, p in enumerate(PEER_IDS) if j != i]
+        assert (live / node.name / "genesis.blob").exists()
+
+    gw_cfg = yaml.safe_load((live / "gw" / "validator.yaml").read_text())
+    assert gw_cfg["p2p-config"]["seed-peers"][2] == {
+        "peer-id": "peerC", "address": "/ip4/10.0.0.3/udp/2021/quic",
+    }
+
+
+def test_prepare_configs_warns_on_peer_id_count_mismatch(genesis_dir, tmp_path, validators, caplog):
+    """Testa o aviso quando o fullnode.yaml não traz um peer-id por validador"""
+    (genesis_dir / "fullnode.yaml").write_text(_fullnode_yaml(PEER_IDS[:2]))
+    live = tmp_path / "live"
+
+    with caplog.at_level("WARNING"):
+        prepare_configs(validators, str(genesis_dir), str(live))
+
+    assert "2 peer-ids in fullnode.yaml for 3 validators" in caplog.text
+    cfg = yaml.safe_load((live / "val1" / "validator.yaml").read_text())
+    assert cfg["p2p-config"]["seed-peers"][-1] == {"address": "/ip4/10.0.0.3/udp/2021/quic"}
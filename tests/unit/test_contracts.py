@@ -54,3 +54,39 @@ def test_contract_manager_call(mock_cli, mock_account_manager):
     
     assert result["effects"]["status"]["status"] == "success"
     manager.executor.run_raw_call.assert_called_once()
+
+def test_contract_manager_build_runs_once(mock_cli, mock_account_manager):
+    manager = SmartContractManager(mock_cli, mock_account_manager)
+    manager.client.cmd.return_value = "BUILDING counter\nBUILD_RC=0\n"
+    manager.executor.extract_modules_from_build = MagicMock(return_value=["counter"])
+
+    result = manager.build_package("/app/contracts/counter/")
+
+    assert manager.client.cmd.call_count == 1
+    assert result["output"] == "BUILDING counter\n"
+    assert result["modules"] == ["counter"]
+
+    manager.client.cmd.return_value = "error[E01]: bad syntax\nBUILD_RC=1\n"
+    with pytest.raises(RuntimeError, match="Move build failed"):
+        manager.build_package("/app/contracts/counter")
+
+    manager.client.cmd.return_value = "NOT_FOUND\n"
+    with pytest.raises(FileNotFoundError):
+        manager.build_package("/app/contracts/counter")
+
+@patch("fogbed_iota.contracts.manager.subprocess.run")
+def test_copy_package_skips_unchanged_tree(mock_run, mock_cli, mock_account_manager, tmp_path):
+    (tmp_path / "Move.toml").write_text("[package]\nname = \"counter\"\n")
+    manager = SmartContractManager(mock_cli, mock_account_manager)
+    manager.executor.resolve_container_id = MagicMock(return_value="abc123")
+    manager.client.cmd.return_value = "OK"
+    mock_run.return_value = MagicMock(returncode=0)
+
+    manager.copy_package_to_container(str(tmp_path), "counter")
+    manager.copy_package_to_container(str(tmp_path), "counter")
+    assert mock_run.call_count == 1
+
+    (tmp_path / "sources").mkdir()
+    (tmp_path / "sources" / "counter.move").write_text("module counter::counter {}\n")
+    manager.copy_package_to_container(str(tmp_path), "counter")
+    assert mock_run.call_count == 2
@@ -7,7 +7,8 @@ Testa funcionalidades principais com mocks
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock
+import httpx
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from fogbed_iota.client import (
     IotaRpcClient,
     AsyncIotaRpcClient,
@@ -18,6 +19,24 @@ from fogbed_iota.client import (
     IotaConnectionError,
     IotaTimeoutError,
 )
+from fogbed_iota.client.rpc_client import _shared_transport, close_shared_pool
+
+
+# Getters simples: (método do cliente, args, método JSON-RPC, resultado)
+RPC_GETTER_CASES = [
+    ("get_chain_identifier", (), "iota_getChainIdentifier", "4c78adac"),
+    ("get_protocol_version", (), "iota_getProtocolVersion", "1.15.0"),
+    ("get_latest_checkpoint_sequence_number", (), "iota_getLatestCheckpointSequenceNumber", 5000),
+    ("get_balance", ("0xabc",), "iotax_getBalance", {"totalBalance": "1000000000", "coinObjectCount": 5}),
+    ("get_checkpoint", ("5000",), "iota_getCheckpoint", {"sequenceNumber": "5000", "epoch": "100"}),
+    ("get_transaction_block", ("TXDIGEST",), "iota_getTransactionBlock",
+     {"digest": "TXDIGEST", "effects": {"status": {"status": "success"}}}),
+    ("get_object", ("0xABC123",), "iota_getObject", {"data": {"objectId": "0xABC123", "balance": "1000000"}}),
+    ("get_owned_objects", ("0xabc",), "iotax_getOwnedObjects",
+     {"data": [{"objectId": "obj1", "type": "0x2::iota::IOTA"}], "hasNextPage": False}),
+    ("get_events", ({"TransactionDigest": "tx123"},), "iota_getEvents",
+     {"data": [{"txDigest": "tx123", "event": {"type": "Transfer"}}], "hasNextPage": False}),
+]
 
 
 # ==================== Testes: IotaRpcClient (Síncrono) ====================
@@ -26,13 +45,12 @@ from fogbed_iota.client import (
 class TestIotaRpcClient:
     """Testes para cliente RPC síncrono"""
 
-    def test_client_initialization(self, mock_rpc_endpoint):
+    def test_client_initialization(self, rpc_client, mock_rpc_endpoint):
         """Testa inicialização do cliente"""
-        client = IotaRpcClient(mock_rpc_endpoint)
-        assert client.endpoint == mock_rpc_endpoint
-        assert client.timeout == 30
-        assert client.headers["Content-Type"] == "application/json"
-        assert client._request_id == 0
+        assert rpc_client.endpoint == mock_rpc_endpoint
+        assert rpc_client.timeout == 30
+        assert rpc_client.headers["Content-Type"] == "application/json"
+        assert rpc_client._next_id() == 1
 
     def test_client_initialization_with_custom_params(self):
         """Testa inicialização com parâmetros customizados"""
@@ -45,140 +63,144 @@ class TestIotaRpcClient:
         assert client.timeout == 60
         assert "Authorization" in client.headers
 
-    def test_next_id_increments(self, mock_rpc_endpoint):
+    def test_next_id_increments(self, rpc_client):
         """Testa incremento de request ID"""
-        client = IotaRpcClient(mock_rpc_endpoint)
-        assert client._next_id() == 1
-        assert client._next_id() == 2
-        assert client._next_id() == 3
-
-    @patch('requests.post')
-    def test_get_chain_identifier_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response
-    ):
-        """Testa obtenção do chain identifier"""
-        mock_post.return_value.json.return_value = mock_rpc_response("4c78adac")
-        mock_post.return_value.raise_for_status = Mock()
+        assert rpc_client._next_id() == 1
+        assert rpc_client._next_id() == 2
+        assert rpc_client._next_id() == 3
+
+    @pytest.mark.parametrize(
+        "method_name, args, expected_rpc, result",
+        RPC_GETTER_CASES,
+        ids=[case[0] for case in RPC_GETTER_CASES],
+    )
+    def test_rpc_getter(self, rpc_client, rpc_stub, method_name, args, expected_rpc, result):
+        """Testa os getters de uma chamada: método, parâmetros e resultado"""
+        rpc_stub.set_response(expected_rpc, result)
+
+        assert getattr(rpc_client, method_name)(*args) == result
+
+        assert rpc_stub.call_count == 1
+        payload = rpc_stub.last_payload
+        assert payload["method"] == expected_rpc
+        assert payload["params"][:len(args)] == list(args)
+
+    def test_chain_identifier_is_cached(self, rpc_client, rpc_stub):
+        """Testa que leituras idempotentes não repetem o round trip"""
+        rpc_stub.set_response("iota_getChainIdentifier", "4c78adac")
+
+        assert rpc_client.get_chain_identifier() == "4c78adac"
+        assert rpc_client.get_chain_identifier() == "4c78adac"
+        assert rpc_stub.call_count == 1
+
+        rpc_client.invalidate_cache()
+        rpc_client.get_chain_identifier()
+        assert rpc_stub.call_count == 2
 
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_chain_identifier()
-
-        assert result == "4c78adac"
-        mock_post.assert_called_once()
-
-        # Verifica payload enviado
-        call_args = mock_post.call_args
-        payload = call_args[1]["json"]
-        assert payload["method"] == "iota_getChainIdentifier"
-        assert payload["params"] == []
-
-    @patch('requests.post')
-    def test_get_balance_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response,
-        test_address, mock_balance_response
-    ):
-        """Testa obtenção de saldo"""
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_balance_response)
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_balance(test_address)
-
-        assert result["totalBalance"] == "1000000000"
-        assert result["coinObjectCount"] == 5
-
-        # Verifica parâmetros
-        payload = mock_post.call_args[1]["json"]
-        assert payload["method"] == "iotax_getBalance"
-        assert payload["params"][0] == test_address
-
-    @patch('requests.post')
     def test_get_coins_with_pagination(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response,
-        test_address, mock_coins_page
+        self, rpc_client, rpc_stub, test_address, mock_coins_page
     ):
         """Testa obtenção de coins com paginação"""
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_coins_page)
-        mock_post.return_value.raise_for_status = Mock()
+        rpc_stub.set_response("iotax_getCoins", mock_coins_page)
 
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_coins(test_address, limit=2)
+        result = rpc_client.get_coins(test_address, limit=2)
 
         assert len(result["data"]) == 2
         assert result["hasNextPage"] is True
         assert result["nextCursor"] == "cursor_abc123"
 
-    @patch('requests.post')
-    def test_get_checkpoint(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response,
-        mock_checkpoint_response
+    def test_iter_coins_follows_cursor(
+        self, rpc_client, rpc_stub, test_address, mock_coins_page
     ):
-        """Testa obtenção de checkpoint"""
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_checkpoint_response)
-        mock_post.return_value.raise_for_status = Mock()
+        """Testa iterador que segue o nextCursor até a última página"""
+        last_page = {"data": [{"coinObjectId": "0xlast"}], "nextCursor": None, "hasNextPage": False}
+        rpc_stub.set_response("iotax_getCoins", mock_coins_page, last_page)
 
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_checkpoint(5000)
+        coins = list(rpc_client.iter_coins(test_address, limit=2))
 
-        assert result["sequenceNumber"] == "5000"
-        assert result["epoch"] == "100"
+        assert len(coins) == len(mock_coins_page["data"]) + 1
+        assert coins[-1]["coinObjectId"] == "0xlast"
+        assert rpc_stub.last_payload["params"][2] == "cursor_abc123"
 
-    @patch('requests.post')
-    def test_get_transaction_block(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response,
-        test_tx_digest, mock_transaction_response
-    ):
-        """Testa obtenção de transaction block"""
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_transaction_response)
-        mock_post.return_value.raise_for_status = Mock()
+    def test_call_batch_orders_results_by_id(self, rpc_client, rpc_stub, test_address):
+        """Testa batch JSON-RPC com respostas fora de ordem"""
+        rpc_stub.set_raw([
+            {"jsonrpc": "2.0", "id": 2, "result": {"totalBalance": "200"}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"totalBalance": "100"}},
+        ])
 
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_transaction_block(test_tx_digest)
+        results = rpc_client.get_balances_batch([test_address, "0xabc"])
 
-        assert result["digest"] == test_tx_digest
-        assert result["effects"]["status"]["status"] == "success"
+        assert [r["totalBalance"] for r in results] == ["100", "200"]
+        assert rpc_stub.call_count == 1
+        payload = rpc_stub.last_payload
+        assert [p["method"] for p in payload] == ["iotax_getBalance"] * 2
+        assert payload[1]["params"][0] == "0xabc"
 
-    @patch('requests.post')
-    def test_rpc_error_handling(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_error
-    ):
+    def test_rpc_error_handling(self, rpc_client, rpc_stub):
         """Testa tratamento de erros RPC"""
-        mock_post.return_value.json.return_value = mock_rpc_error(
-            -32602, "Invalid params"
-        )
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
+        rpc_stub.set_error("iota_getChainIdentifier", -32602, "Invalid params")
 
         with pytest.raises(IotaRpcError) as exc_info:
-            client.get_chain_identifier()
+            rpc_client.get_chain_identifier()
 
         assert exc_info.value.code == -32602
         assert "Invalid params" in exc_info.value.message
 
-    @patch('requests.post')
-    def test_connection_error_handling(self, mock_post, mock_rpc_endpoint):
+    def test_http_status_error_handling(self, rpc_client, rpc_stub):
+        """Testa resposta HTTP não-200 (ex.: proxy na frente do nó)"""
+        rpc_stub.set_raw(b"Bad Gateway", status=502)
+
+        with pytest.raises(IotaConnectionError) as exc_info:
+            rpc_client.get_protocol_version()
+
+        assert "HTTP 502" in str(exc_info.value)
+
+    def test_non_json_body_handling(self, rpc_client, rpc_stub, test_address):
+        """Testa resposta 200 cujo corpo não é JSON-RPC (ex.: página HTML de um proxy)"""
+        rpc_stub.set_raw(b"<html>Service Unavailable</html>")
+
+        with pytest.raises(IotaConnectionError, match="Invalid JSON"):
+            rpc_client.get_chain_identifier()
+        with pytest.raises(IotaConnectionError, match="Invalid JSON"):
+            rpc_client.get_balances_batch([test_address])
+
+        # Array JSON como resposta de uma chamada simples
+        rpc_stub.set_raw([{"jsonrpc": "2.0", "id": 1, "result": "x"}])
+        with pytest.raises(IotaConnectionError, match="Unexpected JSON-RPC response type"):
+            rpc_client.get_protocol_version()
+
+    def test_connection_error_handling(self, rpc_client, rpc_stub):
         """Testa tratamento de erro de conexão"""
         import requests
-        mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
-
-        client = IotaRpcClient(mock_rpc_endpoint)
+        rpc_stub.set_exception(requests.exceptions.ConnectionError("Connection refused"))
 
         with pytest.raises(IotaConnectionError) as exc_info:
-            client.get_chain_identifier()
+            rpc_client.get_chain_identifier()
 
         assert "Connection failed" in str(exc_info.value)
 
-    @patch('requests.post')
-    def test_health_check_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response
-    ):
+    def test_context_manager_closes_session(self, mock_rpc_endpoint):
+        """Testa que a sessão HTTP herda os headers e é fechada no __exit__"""
+        with patch('requests.Session.close') as mock_close:
+            with IotaRpcClient(mock_rpc_endpoint) as client:
+                assert client._session.headers["Content-Type"] == "application/json"
+            mock_close.assert_called_once()
+
+    def test_health_check_success(self, rpc_client, rpc_stub):
         """Testa health check bem-sucedido"""
-        mock_post.return_value.json.return_value = mock_rpc_response("4c78adac")
-        mock_post.return_value.raise_for_status = Mock()
+        rpc_stub.set_response("iota_getChainIdentifier", "4c78adac")
+
+        assert rpc_client.health_check() is True
+
+    @patch('socket.create_connection')
+    def test_health_check_tcp_probe(self, mock_connect, rpc_client):
+        """Testa health check leve (apenas conexão TCP na porta RPC)"""
+        assert rpc_client.health_check(probe="tcp") is True
+        assert mock_connect.call_args[0][0] == ("localhost", 9000)
 
-        client = IotaRpcClient(mock_rpc_endpoint)
-        assert client.health_check() is True
+        mock_connect.side_effect = ConnectionRefusedError()
+        assert rpc_client.health_check(probe="tcp") is False
 
 
 # ==================== Testes: AsyncIotaRpcClient ====================
@@ -194,6 +216,153 @@ class TestAsyncIotaRpcClient:
         assert client.endpoint == mock_rpc_endpoint
         assert client._session is None
 
+    async def test_context_manager_reuses_session(self, mock_rpc_endpoint):
+        """Testa que a sessão HTTP é criada uma vez e fechada no __aexit__"""
+        async with AsyncIotaRpcClient(mock_rpc_endpoint) as client:
+            session = client._session
+            assert session is not None
+            assert client._get_session() is session
+        assert client._session is None
+
+    @pytest.mark.parametrize(
+        "method_name, args, expected_rpc, result",
+        RPC_GETTER_CASES,
+        ids=[case[0] for case in RPC_GETTER_CASES],
+    )
+    async def test_rpc_getter(self, async_rpc_client, rpc_stub, method_name, args, expected_rpc, result):
+        """Testa os getters assíncronos: método, parâmetros e resultado"""
+        rpc_stub.set_response(expected_rpc, result)
+
+        async with async_rpc_client as client:
+            assert await getattr(client, method_name)(*args) == result
+
+        assert rpc_stub.call_count == 1
+        assert rpc_stub.last_payload["method"] == expected_rpc
+        assert rpc_stub.last_payload["params"][:len(args)] == list(args)
+
+    async def test_chain_identifier_is_cached(self, async_rpc_client, rpc_stub):
+        """Testa o cache TTL do cliente assíncrono"""
+        rpc_stub.set_response("iota_getChainIdentifier", "4c78adac")
+
+        async with async_rpc_client as client:
+            assert await client.get_chain_identifier() == "4c78adac"
+            assert await client.get_chain_identifier() == "4c78adac"
+            assert rpc_stub.call_count == 1
+            client.invalidate_cache()
+            await client.get_chain_identifier()
+        assert rpc_stub.call_count == 2
+
+    async def test_rpc_error_handling(self, async_rpc_client, rpc_stub):
+        """Testa erro JSON-RPC virando IotaRpcError"""
+        rpc_stub.set_error("iota_getObject", -32602, "Invalid params")
+
+        async with async_rpc_client as client:
+            with pytest.raises(IotaRpcError) as exc_info:
+                await client.get_object("0xABC123")
+        assert exc_info.value.code == -32602
+
+    @pytest.mark.parametrize("body, status, match", [
+        (b"Bad Gateway", 502, "HTTP 502"),
+        (b"<html>Service Unavailable</html>", 200, "Invalid JSON"),
+        ([{"jsonrpc": "2.0", "id": 1, "result": "x"}], 200, "Unexpected JSON-RPC response type"),
+    ], ids=["http_status", "non_json", "array_for_single_call"])
+    async def test_bad_response_handling(self, async_rpc_client, rpc_stub, body, status, match):
+        """Testa respostas HTTP que não são JSON-RPC válido"""
+        rpc_stub.set_raw(body, status=status)
+
+        async with async_rpc_client as client:
+            with pytest.raises(IotaConnectionError, match=match):
+                await client.get_protocol_version()
+
+    @pytest.mark.parametrize("exc, expected, match", [
+        (httpx.ConnectError("Connection refused"), IotaConnectionError, "Connection failed"),
+        (httpx.ReadTimeout("timed out"), IotaTimeoutError, "timeout"),
+    ], ids=["connect_error", "timeout"])
+    async def test_transport_error_handling(self, async_rpc_client, rpc_stub, exc, expected, match):
+        """Testa erros de transporte do httpx mapeados para as exceções do cliente"""
+        rpc_stub.set_exception(exc)
+
+        async with async_rpc_client as client:
+            with pytest.raises(expected, match=match):
+                await client.get_chain_identifier()
+
+    async def test_call_batch_orders_results_by_id(self, async_rpc_client, rpc_stub, test_address):
+        """Testa batch JSON-RPC assíncrono com respostas fora de ordem"""
+        rpc_stub.set_raw([
+            {"jsonrpc": "2.0", "id": 2, "result": {"totalBalance": "200"}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"totalBalance": "100"}},
+        ])
+
+        async with async_rpc_client as client:
+            results = await client.get_balances_batch([test_address, "0xabc"])
+
+        assert [r["totalBalance"] for r in results] == ["100", "200"]
+        assert rpc_stub.call_count == 1
+
+    async def test_get_balances_fans_out(self, async_rpc_client, rpc_stub):
+        """Testa get_balances: um request por endereço, disparados em paralelo"""
+        rpc_stub.set_response("iotax_getBalance", {"totalBalance": "1"})
+        addresses = ["0xa", "0xb", "0xc"]
+
+        async with async_rpc_client as client:
+            results = await client.get_balances(addresses)
+
+        assert results == [{"totalBalance": "1"}] * 3
+        assert sorted(p["params"][0] for p in rpc_stub.payloads) == addresses
+        assert len({p["id"] for p in rpc_stub.payloads}) == 3
+
+    async def test_iter_coins_follows_cursor(self, async_rpc_client, rpc_stub, test_address, mock_coins_page):
+        """Testa o iterador assíncrono paginado (com prefetch da próxima página)"""
+        last_page = {"data": [{"coinObjectId": "0xlast"}], "nextCursor": None, "hasNextPage": False}
+        rpc_stub.set_response("iotax_getCoins", mock_coins_page, last_page)
+
+        async with async_rpc_client as client:
+            coins = [coin async for coin in client.iter_coins(test_address, limit=2)]
+
+        assert [c["coinObjectId"] for c in coins] == ["0xCOIN001", "0xCOIN002", "0xlast"]
+        assert [p["params"][2] for p in rpc_stub.payloads] == [None, "cursor_abc123"]
+
+    async def test_health_check(self, async_rpc_client, rpc_stub):
+        """Testa health check padrão (chamada JSON-RPC real)"""
+        rpc_stub.set_response("iota_getChainIdentifier", "4c78adac")
+
+        async with async_rpc_client as client:
+            assert await client.health_check() is True
+            rpc_stub.set_exception(httpx.ConnectError("Connection refused"))
+            assert await client.health_check() is False
+
+    async def test_health_check_tcp_probe(self, mock_rpc_endpoint):
+        """Testa probe TCP: a conexão é fechada e aguardada"""
+        writer = MagicMock()
+        writer.wait_closed = AsyncMock()
+        client = AsyncIotaRpcClient(mock_rpc_endpoint)
+
+        with patch("asyncio.open_connection", AsyncMock(return_value=(MagicMock(), writer))) as mock_open:
+            assert await client.health_check(probe="tcp") is True
+        mock_open.assert_awaited_once_with("localhost", 9000)
+        writer.close.assert_called_once()
+        writer.wait_closed.assert_awaited_once()
+
+        with patch("asyncio.open_connection", AsyncMock(side_effect=ConnectionRefusedError())):
+            assert await client.health_check(probe="tcp") is False
+
+    async def test_shared_pool_survives_client_close(self, mock_rpc_endpoint):
+        """Testa que fechar um cliente não fecha o pool compartilhado do loop"""
+        first = AsyncIotaRpcClient(mock_rpc_endpoint, share_pool=True)
+        second = AsyncIotaRpcClient(mock_rpc_endpoint, share_pool=True)
+        try:
+            async with first:
+                pass
+            pool = _shared_transport(first.http2)
+            async with second:
+                assert _shared_transport(second.http2) is pool
+        finally:
+            await close_shared_pool()
+
+        # Depois de close_shared_pool o próximo cliente abre um pool novo
+        assert _shared_transport(first.http2) is not pool
+        await close_shared_pool()
+
 
 # ==================== Testes: IotaGraphQLClient ====================
 
@@ -219,108 +388,3 @@ class TestIotaGraphQLClient:
         result = client.query("query { chainIdentifier }")
 
         assert result["chainIdentifier"] == "4c78adac"
-
-
-# ==================== Testes: IOTA 1.15 Específico ====================
-
-@pytest.mark.unit
-class TestIota15RpcClient:
-    """Testes específicos IOTA 1.15"""
-
-    @patch('requests.post')
-    def test_latest_checkpoint_sequence_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response
-    ):
-        """Testa último checkpoint sequence"""
-        mock_post.return_value.json.return_value = mock_rpc_response(5000)
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_latest_checkpoint_sequence_number()
-
-        assert result == 5000
-        mock_post.assert_called_once()
-
-    @patch('requests.post')
-    def test_latest_checkpoint_success(
-        self, mock_post, mock_rpc_endpoint, mock_checkpoint_response, mock_rpc_response
-    ):
-        """Testa último checkpoint completo"""
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_checkpoint_response)
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_checkpoint(5000)
-
-        assert result["sequenceNumber"] == "5000"
-        assert result["epoch"] == "100"
-        
-        mock_post.assert_called_once()
-
-    @patch('requests.post')
-    def test_owned_objects_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response, test_address
-    ):
-        """Testa objetos de owner"""
-        mock_response = {
-            "data": [{"objectId": "obj1", "type": "0x2::iota::IOTA"}],
-            "hasNextPage": False
-        }
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_response)
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_owned_objects(test_address)
-
-        assert len(result["data"]) == 1
-
-    @patch('requests.post')
-    def test_get_object_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response
-    ):
-        """Testa objeto específico"""
-        mock_obj = {
-            "data": {
-                "objectId": "0xABC123",
-                "type": "0x2::coin::Coin<0x2::iota::IOTA>",
-                "balance": "1000000"
-            }
-        }
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_obj)
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_object("0xABC123")
-
-        assert result["data"]["objectId"] == "0xABC123"
-
-    @patch('requests.post')
-    def test_protocol_version_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response
-    ):
-        """Testa versão do protocolo"""
-        mock_post.return_value.json.return_value = mock_rpc_response("1.15.0")
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        result = client.get_protocol_version()
-
-        assert result == "1.15.0"
-
-    @patch('requests.post')
-    def test_get_events_success(
-        self, mock_post, mock_rpc_endpoint, mock_rpc_response
-    ):
-        """Testa eventos"""
-        mock_events = {
-            "data": [{"txDigest": "tx123", "event": {"type": "Transfer"}}],
-            "hasNextPage": False
-        }
-        mock_post.return_value.json.return_value = mock_rpc_response(mock_events)
-        mock_post.return_value.raise_for_status = Mock()
-
-        client = IotaRpcClient(mock_rpc_endpoint)
-        query = {"TransactionDigest": "tx123"}
-        result = client.get_events(query)
-
-        assert len(result["data"]) == 1
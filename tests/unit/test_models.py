@@ -1,16 +1,13 @@
-# tests/test_models.py
+# tests/unit/test_models.py
 """
 Teste dos modelos de nós IOTA
 Valida estrutura e comportamento das dataclasses
 """
 
-import sys
+import dataclasses
 import os
-from pathlib import Path
 
-# Adicionar diretório raiz ao path (correto para tests/)
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+import pytest
 
 from fogbed_iota.models import (
     NodeRole,
@@ -18,15 +15,18 @@ from fogbed_iota.models import (
     IotaNodeMetadata,
     ValidatorNode,
     FullnodeNode,
+    NodePool,
     create_validator,
     create_fullnode,
 )
 from fogbed_iota.utils import setup_logging, get_logger
 
-# Setup logging
-setup_logging(level="DEBUG")
+# Setup logging: WARNING por padrão; TEST_LOG=DEBUG para ver o passo a passo
+setup_logging(level=os.environ.get("TEST_LOG", "WARNING"))
 logger = get_logger('test_models')
 
+pytestmark = pytest.mark.unit
+
 
 def test_node_role():
     """Testa enum NodeRole"""
@@ -62,12 +62,12 @@ def test_iota_node_config():
         image="iota-dev:latest"
     )
     
-    logger.info(f"✅ Config created: {config.name}")
-    logger.info(f"   IP: {config.ip}")
-    logger.info(f"   Role: {config.role}")
-    logger.info(f"   P2P Port: {config.p2p_port}")
-    logger.info(f"   RPC Port: {config.rpc_port}")
-    logger.info(f"   Metrics Port: {config.metrics_port}")
+    logger.info("✅ Config created: %s", config.name)
+    logger.info("   IP: %s", config.ip)
+    logger.info("   Role: %s", config.role)
+    logger.info("   P2P Port: %s", config.p2p_port)
+    logger.info("   RPC Port: %s", config.rpc_port)
+    logger.info("   Metrics Port: %s", config.metrics_port)
     
     # Testar que portas foram calculadas
     assert config.p2p_port == 2001
@@ -95,38 +95,29 @@ def test_iota_node_config_validation():
     logger.info("=" * 60)
     
     # Testar nome inválido - ESPERADO: ValueError
-    try:
-        config = IotaNodeConfig(
+    with pytest.raises(ValueError):
+        IotaNodeConfig(
             name="invalid-name@123",  # Caracteres inválidos
             ip="10.0.0.1"
         )
-        logger.error("❌ Should have rejected invalid name")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        logger.info(f"✅ Rejected invalid name (expected)")
+    logger.info("✅ Rejected invalid name (expected)")
     
     # Testar IP inválido - ESPERADO: ValueError
-    try:
-        config = IotaNodeConfig(
+    with pytest.raises(ValueError):
+        IotaNodeConfig(
             name="iota1",
             ip="999.999.999.999"  # IP inválido
         )
-        logger.error("❌ Should have rejected invalid IP")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        logger.info(f"✅ Rejected invalid IP (expected)")
+    logger.info("✅ Rejected invalid IP (expected)")
     
     # Testar role inválido - ESPERADO: ValueError
-    try:
-        config = IotaNodeConfig(
+    with pytest.raises(ValueError):
+        IotaNodeConfig(
             name="iota1",
             ip="10.0.0.1",
             role="invalid_role"  # Role inválida
         )
-        logger.error("❌ Should have rejected invalid role")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        logger.info(f"✅ Rejected invalid role (expected)")
+    logger.info("✅ Rejected invalid role (expected)")
 
 
 def test_iota_node_metadata():
@@ -144,9 +135,9 @@ def test_iota_node_metadata():
     
     metadata = IotaNodeMetadata.from_config(config)
     
-    logger.info(f"✅ Metadata created for {config.name}")
-    logger.info(f"   Container: {metadata.container_name}")
-    logger.info(f"   Status: {metadata.status}")
+    logger.info("✅ Metadata created for %s", config.name)
+    logger.info("   Container: %s", metadata.container_name)
+    logger.info("   Status: %s", metadata.status)
     
     assert metadata.container_name == "mn.iota1"
     assert metadata.status == "created"
@@ -173,10 +164,10 @@ def test_validator_node():
     # Criar com factory function
     validator = create_validator("iota1", "10.0.0.1", port_offset=0)
     
-    logger.info(f"✅ Validator created: {validator.config.name}")
-    logger.info(f"   Role: {validator.config.role}")
-    logger.info(f"   P2P Address: {validator.get_p2p_address()}")
-    logger.info(f"   Consensus DB: {validator.get_consensus_db_path()}")
+    logger.info("✅ Validator created: %s", validator.config.name)
+    logger.info("   Role: %s", validator.config.role)
+    logger.info("   P2P Address: %s", validator.get_p2p_address())
+    logger.info("   Consensus DB: %s", validator.get_consensus_db_path())
     
     assert validator.config.role == NodeRole.VALIDATOR
     assert validator.get_p2p_address() == "/ip4/10.0.0.1/udp/2001"
@@ -184,17 +175,14 @@ def test_validator_node():
     logger.info("✅ ValidatorNode properties correct")
     
     # Testar que rejeita role errada
-    try:
-        config = IotaNodeConfig(
-            name="bad",
-            ip="10.0.0.1",
-            role=NodeRole.FULLNODE
-        )
-        validator_bad = ValidatorNode(config=config)
-        logger.error("❌ Should have rejected fullnode role")
-        assert False
-    except ValueError as e:
-        logger.info(f"✅ Rejected wrong role (expected)")
+    config = IotaNodeConfig(
+        name="bad",
+        ip="10.0.0.1",
+        role=NodeRole.FULLNODE
+    )
+    with pytest.raises(ValueError):
+        ValidatorNode(config=config)
+    logger.info("✅ Rejected wrong role (expected)")
 
 
 def test_fullnode_node():
@@ -206,11 +194,11 @@ def test_fullnode_node():
     # Criar com factory function
     fullnode = create_fullnode("gateway", "10.0.0.5", port_offset=4)
     
-    logger.info(f"✅ Fullnode created: {fullnode.config.name}")
-    logger.info(f"   Role: {fullnode.config.role}")
-    logger.info(f"   P2P Address: {fullnode.get_p2p_address()}")
-    logger.info(f"   RPC Endpoint: {fullnode.get_rpc_endpoint()}")
-    logger.info(f"   Metrics: {fullnode.get_metrics_endpoint()}")
+    logger.info("✅ Fullnode created: %s", fullnode.config.name)
+    logger.info("   Role: %s", fullnode.config.role)
+    logger.info("   P2P Address: %s", fullnode.get_p2p_address())
+    logger.info("   RPC Endpoint: %s", fullnode.get_rpc_endpoint())
+    logger.info("   Metrics: %s", fullnode.get_metrics_endpoint())
     
     assert fullnode.config.role == NodeRole.FULLNODE
     assert fullnode.get_rpc_endpoint() == "http://10.0.0.5:9040"  # certo com offset 4
@@ -218,17 +206,14 @@ def test_fullnode_node():
     logger.info("✅ FullnodeNode properties correct")
     
     # Testar que rejeita role errada
-    try:
-        config = IotaNodeConfig(
-            name="bad",
-            ip="10.0.0.1",
-            role=NodeRole.VALIDATOR
-        )
-        fullnode_bad = FullnodeNode(config=config)
-        logger.error("❌ Should have rejected validator role")
-        assert False
-    except ValueError as e:
-        logger.info(f"✅ Rejected wrong role (expected)")
+    config = IotaNodeConfig(
+        name="bad",
+        ip="10.0.0.1",
+        role=NodeRole.VALIDATOR
+    )
+    with pytest.raises(ValueError):
+        FullnodeNode(config=config)
+    logger.info("✅ Rejected wrong role (expected)")
 
 
 def test_port_offset():
@@ -247,53 +232,31 @@ def test_port_offset():
         expected_p2p = 2001 + (offset * 10)
         assert config.p2p_port == expected_p2p
         
-        logger.info(f"✅ Offset {offset}: P2P port = {config.p2p_port}")
+        logger.info("✅ Offset %s: P2P port = %s", offset, config.p2p_port)
 
 
-def run_all_tests():
-    """Executa todos os testes"""
-    logger.info("\n")
-    logger.info("🧪 INICIANDO TESTES DE MODELOS")
-    logger.info("")
-    
-    try:
-        test_node_role()
-        logger.info("")
-        
-        test_iota_node_config()
-        logger.info("")
-        
-        test_iota_node_config_validation()
-        logger.info("")
-        
-        test_iota_node_metadata()
-        logger.info("")
-        
-        test_validator_node()
-        logger.info("")
-        
-        test_fullnode_node()
-        logger.info("")
-        
-        test_port_offset()
-        logger.info("")
-        
-        logger.info("=" * 60)
-        logger.info("✅ TODOS OS TESTES PASSARAM!")
-        logger.info("=" * 60)
-        
-        return True
-    
-    except Exception as e:
-        logger.error("")
-        logger.error("=" * 60)
-        logger.error(f"❌ TESTE FALHOU: {e}")
-        logger.error("=" * 60)
-        import traceback
-        traceback.print_exc()
-        return False
+def test_derived_addresses_follow_config():
+    """Testa que os endereços derivados acompanham o ip e não são campos"""
+    config = IotaNodeConfig(name="iota1", ip="10.0.0.1")
+    assert config.metrics_url == "http://10.0.0.1:9184/metrics"
+
+    config.ip = "10.0.0.9"
+    assert config.rpc_url == "http://10.0.0.9:9000"
+    assert config.p2p_multiaddr == "/ip4/10.0.0.9/udp/2001"
+    assert "rpc_url" not in {f.name for f in dataclasses.fields(config)}
+
 
+def test_node_pool():
+    """Testa visão em colunas de um conjunto de nós"""
+    nodes = [
+        create_validator("iota1", "10.0.0.1", port_offset=0),
+        create_fullnode("gateway", "10.0.0.5", port_offset=4),
+    ]
+    pool = NodePool(nodes)
 
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    assert len(pool) == 2
+    assert pool.ips == ["10.0.0.1", "10.0.0.5"]
+    assert pool.p2p_addrs[0] == "/ip4/10.0.0.1/udp/2001"
+    assert pool.rpc_urls == [None, "http://10.0.0.5:9040"]
+    assert pool.rpc_endpoints() == ["http://10.0.0.5:9040"]
+    logger.info("✅ NodePool: %s", pool.names)
@@ -28,6 +28,15 @@ def test_add_validator(mock_fogbed_exp):
     assert node.name == "val1"
     assert node.role == "validator"
 
+def test_add_validators(mock_fogbed_exp):
+    network = IotaNetwork(mock_fogbed_exp)
+    
+    nodes = network.add_validators([("val1", "10.0.0.1"), ("val2", "10.0.0.2")])
+    
+    assert [n.name for n in nodes] == ["val1", "val2"]
+    assert network.nodes == nodes
+    assert nodes[1].port_offset == 1
+
 def test_add_fullnode(mock_fogbed_exp):
     network = IotaNetwork(mock_fogbed_exp)
     
@@ -77,3 +86,13 @@ def test_start_network(
     mock_wait.assert_called_once()
     network._configure_client.assert_called_once()
     network._setup_smart_contract_env.assert_called_once()
+
+def test_stop_kills_every_node(mock_fogbed_exp):
+    network = IotaNetwork(mock_fogbed_exp, auto_cleanup=False)
+    network.nodes = [MagicMock(), MagicMock(), MagicMock()]
+    network.nodes[1].cmd.side_effect = RuntimeError("shell gone")
+
+    network.stop()
+
+    for node in network.nodes:
+        node.cmd.assert_called_once_with("pkill -9 iota-node 2>/dev/null || true")